@@ -39,10 +39,7 @@
                                    0
                                    (/ plate-thickness 2)]))
         plate-half (union top-wall left-wall)]
-    (union plate-half
-           (->> plate-half
-                (mirror [1 0 0])
-                (mirror [0 1 0])))))
+    (union-with-half-turn plate-half)))
 
 (def alps-width 15.6)
 (def alps-notch-width 15.5)
@@ -65,10 +62,7 @@
                                              (/ alps-notch-height 2))]))
                          )
         plate-half (union top-wall left-wall)]
-    (union plate-half
-           (->> plate-half
-                (mirror [1 0 0])
-                (mirror [0 1 0])))))
+    (union-with-half-turn plate-half)))
 
 (def cherry-backplate
   (rotate backplate-orientation [0 0 1]
@@ -97,10 +91,7 @@
                                    0
                                    (/ height -2)]))
         walls-half (union top-wall left-wall)]
-    (union walls-half
-           (->> walls-half
-                (mirror [1 0 0])
-                (mirror [0 1 0])))))
+    (union-with-half-turn walls-half)))
 
 (def cherry-plate-with-key-mount
   (union
@@ -122,42 +113,23 @@
 
 (def sa-length 18.25)
 (def sa-double-length 37.5)
-(def sa-cap {1 (let [bl2 (/ 18.5 2)
-                     m (/ 17 2)
-                     key-cap (hull (->> (polygon [[bl2 bl2] [bl2 (- bl2)] [(- bl2) (- bl2)] [(- bl2) bl2]])
-                                        (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                        (translate [0 0 0.05]))
-                                   (->> (polygon [[m m] [m (- m)] [(- m) (- m)] [(- m) m]])
-                                        (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                        (translate [0 0 6]))
-                                   (->> (polygon [[6 6] [6 -6] [-6 -6] [-6 6]])
-                                        (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                        (translate [0 0 12])))]
-                 (->> key-cap
+; One thin, flat slice of a keycap's profile; the caps are hulls of a few of these
+(defn sa-cap-slice [width length z]
+  (translate [0 0 z] (cube width length 0.1)))
+
+(def sa-cap {1 (->> (hull (sa-cap-slice 18.5 18.5 0.05)
+                          (sa-cap-slice 17 17 6)
+                          (sa-cap-slice 12 12 12))
+                    (translate [0 0 (+ 5 plate-thickness)])
+                    (color [220/255 163/255 163/255 1]))
+             2 (->> (hull (sa-cap-slice 18.25 sa-double-length 0.05)
+                          (sa-cap-slice 12 32 12))
+                    (translate [0 0 (+ 5 plate-thickness)])
+                    (color [127/255 159/255 127/255 1]))
+             1.5 (->> (hull (sa-cap-slice 28 18.25 0.05)
+                            (sa-cap-slice 22 12 12))
                       (translate [0 0 (+ 5 plate-thickness)])
-                      (color [220/255 163/255 163/255 1])))
-             2 (let [bl2 (/ sa-double-length 2)
-                     bw2 (/ 18.25 2)
-                     key-cap (hull (->> (polygon [[bw2 bl2] [bw2 (- bl2)] [(- bw2) (- bl2)] [(- bw2) bl2]])
-                                        (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                        (translate [0 0 0.05]))
-                                   (->> (polygon [[6 16] [6 -16] [-6 -16] [-6 16]])
-                                        (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                        (translate [0 0 12])))]
-                 (->> key-cap
-                      (translate [0 0 (+ 5 plate-thickness)])
-                      (color [127/255 159/255 127/255 1])))
-             1.5 (let [bl2 (/ 18.25 2)
-                       bw2 (/ 28 2)
-                       key-cap (hull (->> (polygon [[bw2 bl2] [bw2 (- bl2)] [(- bw2) (- bl2)] [(- bw2) bl2]])
-                                          (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                          (translate [0 0 0.05]))
-                                     (->> (polygon [[11 6] [-11 6] [-11 -6] [11 -6]])
-                                          (extrude-linear {:height 0.1 :twist 0 :convexity 0})
-                                          (translate [0 0 12])))]
-                   (->> key-cap
-                        (translate [0 0 (+ 5 plate-thickness)])
-                        (color [240/255 223/255 175/255 1])))})
+                      (color [240/255 223/255 175/255 1]))})
 
 ;;;;;;;;;;;;;;;;;;;;;;;;;
 ;; Placement Functions ;;
@@ -176,59 +148,77 @@
                          (Math/sin (/ β 2)))
                       cap-top-height))
 
-(defn key-place [column row shape]
-  (let [row-placed-shape (->> shape
-                              (translate [0 0 (- row-radius)])
-                              (rotate (* α (- 2 row)) [1 0 0])
-                              (translate [0 0 row-radius]))
-        column (if (>= column 5) (+ column (* (+ -4 column) 0.25)) column)
-        column-offset (cond
-                        (= column 2) [0 2.82 -3.0] ;;was moved -4.5
-                        (>= column 4) [0 -5.8 5.64]
-                        :else [0 0 0])
-        column-angle (* β (- 2 column))
-        placed-shape (->> row-placed-shape
-                          (translate [0 0 (- column-radius)])
-                          (rotate column-angle [0 1 0])
-                          (translate [0 0 column-radius])
-                          (translate column-offset))]
-    (->> placed-shape
-         (rotate (/ π 10) [0 1 0])
-         (translate [0 0 22]))))
+; Tilts the whole keyboard and lifts it off the desk; shared by the key and case placements
+(def keyboard-tilt
+  (compose-transforms
+    (rotation-matrix (/ π 10) [0 1 0])
+    (translation-matrix [0 0 22])))
+
+; Memoized, so each key position's matrix is composed once and shared by everything placed there
+(def key-place-transform
+  (memoize
+    (fn [column row]
+      (let [column (if (>= column 5) (+ column (* (+ -4 column) 0.25)) column)
+            [x-offset y-offset z-offset] (cond
+                                           (= column 2) [0 2.82 -3.0] ;;was moved -4.5
+                                           (>= column 4) [0 -5.8 5.64]
+                                           :else [0 0 0])
+            column-angle (* β (- 2 column))]
+        (compose-transforms
+          (translation-matrix [0 0 (- row-radius)])
+          (rotation-matrix (* α (- 2 row)) [1 0 0])
+          (translation-matrix [0 0 (- row-radius column-radius)])
+          (rotation-matrix column-angle [0 1 0])
+          (translation-matrix [x-offset y-offset (+ column-radius z-offset)])
+          keyboard-tilt)))))
+
+; Memoized, since the connectors and walls place the same web posts at the same keys many times over
+(def key-place
+  (memoize
+    (fn [column row shape]
+      (rounded-multmatrix (key-place-transform column row) shape))))
+
+; Memoized, since each point along the walls places both a top and a bottom sphere
+(def case-place-transform
+  (memoize
+    (fn [column row]
+      (let [column (if (> column 4.5) (+ column (* (+ -4.5 column) 0.5)) column)
+            [x-offset y-offset z-offset] [0 -4.35 5.64]
+            column-angle (* β (- 2 column))]
+        (compose-transforms
+          (translation-matrix [0 0 (- row-radius)])
+          (rotation-matrix (* α (- 2 row)) [1 0 0])
+          (translation-matrix [0 0 (- row-radius column-radius)])
+          (rotation-matrix column-angle [0 1 0])
+          (translation-matrix [x-offset y-offset (+ column-radius z-offset)])
+          keyboard-tilt)))))
 
 (defn case-place [column row shape]
-  (let [row-placed-shape (->> shape
-                              (translate [0 0 (- row-radius)])
-                              (rotate (* α (- 2 row)) [1 0 0])
-                              (translate [0 0 row-radius]))
-        column (if (> column 4.5) (+ column (* (+ -4.5 column) 0.5)) column)
-        column-offset [0 -4.35 5.64]
-        column-angle (* β (- 2 column))
-        placed-shape (->> row-placed-shape
-                          (translate [0 0 (- column-radius)])
-                          (rotate column-angle [0 1 0])
-                          (translate [0 0 column-radius])
-                          (translate column-offset))]
-    (->> placed-shape
-         (rotate (/ π 10) [0 1 0])
-         (translate [0 0 22]))))
+  (rounded-multmatrix (case-place-transform column row) shape))
+
+; Every [column row] that has a key; the bottom key of the first column is left out.
+(def key-positions
+  (for [column columns
+        row rows
+        :when (or (not= column 0)
+                  (not= row 4))]
+    [column row]))
+
+(def key-position? (set key-positions))
 
 (def key-holes
   (apply union
-         (for [column columns
-               row rows
-               :when (or (not= column 0)
-                         (not= row 4))]
+         (for [[column row] key-positions]
            (->> single-plate
                 (key-place column row)))))
 
+; Keycap size (in units) for each column that doesn't use 1u caps
+(def column-cap-sizes {5 1.5})
+
 (def caps
   (apply union
-         (for [column columns
-               row rows
-               :when (or (not= column 0)
-                         (not= row 4))]
-           (->> (sa-cap (if (= column 5) 1.5 1))
+         (for [[column row] key-positions]
+           (->> (sa-cap (get column-cap-sizes column 1))
                 (key-place column row)))))
 
 ;;;;;;;;;;;;;;;;;;;;
@@ -247,71 +237,78 @@
 (def web-post-bl (translate [(+ (/ mount-width -2) post-adj) (+ (/ mount-height -2) post-adj) 0] web-post))
 (def web-post-br (translate [(- (/ mount-width 2) post-adj) (+ (/ mount-height -2) post-adj) 0] web-post))
 
+; Walks the key positions once, joining each key to its neighbours to the right and below
+; wherever those neighbours have keys too
 (def connectors
-  (apply union
-         (concat
-          ;; Row connections
-          (for [column (drop-last columns)
-                row rows
-                :when (or (not= column 0)
-                          (not= row 4))]
-            (triangle-hulls
-             (key-place (inc column) row web-post-tl)
-             (key-place column row web-post-tr)
-             (key-place (inc column) row web-post-bl)
-             (key-place column row web-post-br)))
-
-          ;; Column connections
-          (for [column columns
-                row (drop-last rows)
-                :when (or (not= column 0)
-                          (not= row 3))]
-            (triangle-hulls
-             (key-place column row web-post-bl)
-             (key-place column row web-post-br)
-             (key-place column (inc row) web-post-tl)
-             (key-place column (inc row) web-post-tr)))
-
-          ;; Diagonal connections
-          (for [column (drop-last columns)
-                row (drop-last rows)
-                :when (or (not= column 0)
-                          (not= row 3))]
-            (triangle-hulls
-             (key-place column row web-post-br)
-             (key-place column (inc row) web-post-tr)
-             (key-place (inc column) row web-post-bl)
-             (key-place (inc column) (inc row) web-post-tl))))))
+  (balanced-union
+    (apply concat
+           (for [[column row] key-positions]
+             (concat
+               ;; Row connections
+               (when (key-position? [(inc column) row])
+                 (triangle-hull-seq
+                  (key-place (inc column) row web-post-tl)
+                  (key-place column row web-post-tr)
+                  (key-place (inc column) row web-post-bl)
+                  (key-place column row web-post-br)))
+
+               ;; Column connections
+               (when (key-position? [column (inc row)])
+                 (triangle-hull-seq
+                  (key-place column row web-post-bl)
+                  (key-place column row web-post-br)
+                  (key-place column (inc row) web-post-tl)
+                  (key-place column (inc row) web-post-tr)))
+
+               ;; Diagonal connections
+               (when (every? key-position? [[(inc column) row]
+                                            [column (inc row)]
+                                            [(inc column) (inc row)]])
+                 (triangle-hull-seq
+                  (key-place column row web-post-br)
+                  (key-place column (inc row) web-post-tr)
+                  (key-place (inc column) row web-post-bl)
+                  (key-place (inc column) (inc row) web-post-tl))))))))
 
 ;;;;;;;;;;;;
 ;; Thumbs ;;
 ;;;;;;;;;;;;
 
-(defn thumb-place [column row shape]
-  (let [cap-top-height (+ plate-thickness sa-profile-key-height)
-        α (/ π 12)
-        row-radius (+ (/ (/ (+ mount-height 1) 2)
-                         (Math/sin (/ α 2)))
-                      cap-top-height)
-        β (/ π 17)
-        column-radius (+ (/ (/ (+ mount-width 2) 2)
-                            (Math/sin (/ β 2)))
-                         cap-top-height)
-        #_(+ (/ (/ (+ pillar-width 5) 2)
-                            (Math/sin (/ β 2)))
-                         cap-top-height)]
-    (->> shape
-         (translate [0 0 (- row-radius)])
-         (rotate (* α row) [1 0 0])
-         (translate [0 0 row-radius])
-         (translate [0 0 (- column-radius)])
-         (rotate (* column β) [0 1 0])
-         (translate [0 0 column-radius])
-         (translate [mount-width 0 0])
-         (rotate (* π 7/32) [0 0 1])
-         (rotate (/ π 12) [1 1 0])
-         (rotate (/ π -11/6) [-1 1 0])
-         (translate [-37 -42 48]))))
+(def thumb-α (/ π 12))
+(def thumb-β (/ π 17))
+(def thumb-row-radius (+ (/ (/ (+ mount-height 1) 2)
+                            (Math/sin (/ thumb-α 2)))
+                         cap-top-height))
+(def thumb-column-radius (+ (/ (/ (+ mount-width 2) 2)
+                               (Math/sin (/ thumb-β 2)))
+                            cap-top-height)
+  #_(+ (/ (/ (+ pillar-width 5) 2)
+          (Math/sin (/ thumb-β 2)))
+       cap-top-height))
+
+; Moves the thumb cluster from the origin into its position next to the main keys
+(def thumb-cluster-placement
+  (compose-transforms
+    (translation-matrix [mount-width 0 thumb-column-radius])
+    (rotation-matrix (* π 7/32) [0 0 1])
+    (rotation-matrix (/ π 12) [1 1 0])
+    (rotation-matrix (/ π -11/6) [-1 1 0])
+    (translation-matrix [-37 -42 48])))
+
+(def thumb-place-transform
+  (memoize
+    (fn [column row]
+      (compose-transforms
+        (translation-matrix [0 0 (- thumb-row-radius)])
+        (rotation-matrix (* thumb-α row) [1 0 0])
+        (translation-matrix [0 0 (- thumb-row-radius thumb-column-radius)])
+        (rotation-matrix (* column thumb-β) [0 1 0])
+        thumb-cluster-placement))))
+
+(def thumb-place
+  (memoize
+    (fn [column row shape]
+      (rounded-multmatrix (thumb-place-transform column row) shape))))
 
 (defn thumb-2x-column [shape]
   (union (thumb-place 0 -1/2 shape)
@@ -332,10 +329,22 @@
    (thumb-2x+1-column shape)
    (thumb-1x-column shape)))
 
+; Height of the extra plate above and below a 1u key mount that makes up a 2u key mount
+(def double-plate-height (/ (- sa-double-length mount-height) 2))
+
+; Corner posts of the 2u thumb keys
+(def thumb-tl (->> web-post-tl
+                   (translate [0 double-plate-height 0])))
+(def thumb-bl (->> web-post-bl
+                   (translate [0 (- double-plate-height) 0])))
+(def thumb-tr (->> web-post-tr
+                   (translate [0 double-plate-height 0])))
+(def thumb-br (->> web-post-br
+                   (translate [0 (- double-plate-height) 0])))
+
 (def double-plates
-  (let [plate-height (/ (- sa-double-length mount-height) 2)
-        top-plate (->> (cube mount-width plate-height web-thickness)
-                       (translate [0 (/ (+ plate-height mount-height) 2)
+  (let [top-plate (->> (cube mount-width double-plate-height web-thickness)
+                       (translate [0 (/ (+ double-plate-height mount-height) 2)
                                    (- plate-thickness (/ web-thickness 2))]))
         stabilizer-cutout (union (->> (cube 14.2 3.5 web-thickness)
                                       (translate [0.5 12 (- plate-thickness (/ web-thickness 2))])
@@ -356,129 +365,121 @@
 
 (def thumb-switch-clearance 12)  ;;Clearance for the depth of the switch - only needed for the bottom right 2x key and the top right 1x key
 
+(def web-post-tr-clearance (->> web-post-tr
+                                (translate [0 0 (- web-thickness thumb-switch-clearance)])))
+(def web-post-br-clearance (->> web-post-br
+                                (translate [0 0 (- web-thickness thumb-switch-clearance)])))
+
 (def thumb-connectors
-  (union
-   (apply union
-          (concat
-           (for [column [1 2] row [1]]
-             (triangle-hulls (thumb-place column row web-post-br)
-                             (thumb-place column row web-post-tr)
-                             (thumb-place (dec column) row web-post-bl)
-                             (thumb-place (dec column) row web-post-tl)))
-           (for [column [2] row [0 1]]
-             (triangle-hulls
-              (thumb-place column row web-post-bl)
-              (thumb-place column row web-post-br)
-              (thumb-place column (dec row) web-post-tl)
-              (thumb-place column (dec row) web-post-tr)))))
-   (let [plate-height (/ (- sa-double-length mount-height) 2)
-         thumb-tl (->> web-post-tl
-                       (translate [0 plate-height 0]))
-         thumb-bl (->> web-post-bl
-                       (translate [0 (- plate-height) 0]))
-         thumb-tr (->> web-post-tr
-                       (translate [0 plate-height 0]))
-         thumb-br (->> web-post-br
-                       (translate [0 (- plate-height) 0]))
-         web-post-tr-clearance (->> web-post-tr
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         web-post-br-clearance (->> web-post-br
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         thumb-tl-clearance (->> thumb-tl
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         thumb-tr-clearance (->> thumb-tr
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         thumb-br-clearance (->> thumb-br
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-
-         edge-size (/ web-thickness 4)
-         web-edge (->> (cube edge-size edge-size web-thickness)
-                       (translate [0 0 (+ (/ web-thickness -2) plate-thickness)]))
-         edge-adj (/ edge-size 2)
-         web-edge-tr (translate [(- (/ mount-width 2) edge-adj) (- (/ mount-height 2) edge-adj) 0] web-edge)
-         web-edge-br (translate [(- (/ mount-width 2) edge-adj) (+ (/ mount-height -2) edge-adj) 0] web-edge)
-         web-edge-tr-clearance (->> web-edge-tr
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         web-edge-br-clearance (->> web-edge-br
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         thumb-edge-tr (->> web-edge-tr
-                       (translate [0 plate-height 0]))
-         thumb-edge-br (->> web-edge-br
-                       (translate [0 (- plate-height) 0]))
-         thumb-edge-tr-clearance (->> thumb-edge-tr
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))
-         thumb-edge-br-clearance (->> thumb-edge-br
-                       (translate [0 0 (- web-thickness thumb-switch-clearance)]))]
-     (union
-
-      ;;Connecting the two doubles
-      (triangle-hulls (thumb-place 0 -1/2 thumb-tl)
-                      (thumb-place 0 -1/2 thumb-bl)
-                      (thumb-place 1 -1/2 thumb-tr)
-                      (thumb-place 1 -1/2 thumb-br))
-
-      ;;Connecting the middle double to the one above it
-      (triangle-hulls (thumb-place 1 -1/2 thumb-tr)
-                      (thumb-place 1 -1/2 thumb-tl)
-                      (thumb-place 1 1 web-post-br)
-                      (thumb-place 1 1 web-post-bl))
-
-      ;;Connecting the 3 singles in the top left with the middle double
-      (triangle-hulls (thumb-place 1 1 web-post-bl)
-                      (thumb-place 1 -1/2 thumb-tl)
-                      (thumb-place 2 1 web-post-br)
-                      (thumb-place 2 0 web-post-tr))
-
-      ;;Connecting the two singles in the lower left with the middle double
-      (hull (thumb-place 1 -1/2 thumb-tl)
-            (thumb-place 1 -1/2 thumb-bl)
-            (thumb-place 2 0 web-post-br)
-            (thumb-place 2 -1 web-post-tr))
-      (hull (thumb-place 1 -1/2 thumb-tl)
-            (thumb-place 2 0 web-post-tr)
-            (thumb-place 2 0 web-post-br))
-      (hull (thumb-place 1 -1/2 thumb-bl)
-            (thumb-place 2 -1 web-post-tr)
-            (thumb-place 2 -1 web-post-br))
-
-      ;;Connecting the right double to the one above it
-      (triangle-hulls (thumb-place 0 -1/2 thumb-tr)
-                      (thumb-place 0 -1/2 thumb-tl)
-                      (thumb-place 0 1 web-post-br)
-                      (thumb-place 0 1 web-post-bl))
-
-      ;;Connecting the 2 singles in the top right with the 2 doubles
-      (triangle-hulls (thumb-place 0 1 web-post-bl)
-                      (thumb-place 0 -1/2 thumb-tl)
-                      (thumb-place 1 1 web-post-br)
-                      (thumb-place 1 -1/2 thumb-tr))
-
-      ;;Connecting the thumb to everything
-      ;(triangle-hulls (thumb-place 0 -1/2 thumb-br-clearance)
-      ;                (key-place 1 4 web-post-bl)
-      ;                (thumb-place 0 -1/2 thumb-tr-clearance)
-      ;                (key-place 1 4 web-post-tl)
-      ;                (key-place 1 3 web-post-bl)
-      ;                (thumb-place 0 -1/2 thumb-tr-clearance)
-      ;                (key-place 0 3 web-post-br)
-      ;                (key-place 0 3 web-post-bl)
-      ;                (thumb-place 0 -1/2 thumb-tr-clearance)
-      ;                (key-place 0 3 web-post-tl)
-      ;                (thumb-place 0 1 web-post-br-clearance)
-      ;                (thumb-place 0 1 web-post-tr-clearance))
-      ;(hull (thumb-place 0 -1/2 thumb-edge-tr)
-      ;      (thumb-place 0 -1/2 thumb-edge-tr-clearance)
-      ;      (thumb-place 0 -1/2 thumb-edge-br-clearance)
-      ;      (thumb-place 0 -1/2 thumb-edge-br))
-      ;(hull (thumb-place 0 -1/2 thumb-edge-tr)
-      ;      (thumb-place 0 -1/2 thumb-edge-tr-clearance)
-      ;      (thumb-place 0 1 web-edge-br-clearance)
-      ;      (thumb-place 0 1 web-edge-br))
-      ;(hull (thumb-place 0 1 web-edge-tr)
-      ;      (thumb-place 0 1 web-edge-tr-clearance)
-      ;      (thumb-place 0 1 web-edge-br-clearance)
-      ;      (thumb-place 0 1 web-edge-br))
-      ))))
+  (let [thumb-tl-clearance (->> thumb-tl
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+        thumb-tr-clearance (->> thumb-tr
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+        thumb-br-clearance (->> thumb-br
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+
+        edge-size (/ web-thickness 4)
+        web-edge (->> (cube edge-size edge-size web-thickness)
+                      (translate [0 0 (+ (/ web-thickness -2) plate-thickness)]))
+        edge-adj (/ edge-size 2)
+        web-edge-tr (translate [(- (/ mount-width 2) edge-adj) (- (/ mount-height 2) edge-adj) 0] web-edge)
+        web-edge-br (translate [(- (/ mount-width 2) edge-adj) (+ (/ mount-height -2) edge-adj) 0] web-edge)
+        web-edge-tr-clearance (->> web-edge-tr
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+        web-edge-br-clearance (->> web-edge-br
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+        thumb-edge-tr (->> web-edge-tr
+                      (translate [0 double-plate-height 0]))
+        thumb-edge-br (->> web-edge-br
+                      (translate [0 (- double-plate-height) 0]))
+        thumb-edge-tr-clearance (->> thumb-edge-tr
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+        thumb-edge-br-clearance (->> thumb-edge-br
+                      (translate [0 0 (- web-thickness thumb-switch-clearance)]))]
+    (apply union
+           (concat
+             (apply concat
+                    (for [column [1 2] row [1]]
+                      (triangle-hull-seq (thumb-place column row web-post-br)
+                                         (thumb-place column row web-post-tr)
+                                         (thumb-place (dec column) row web-post-bl)
+                                         (thumb-place (dec column) row web-post-tl))))
+             (apply concat
+                    (for [column [2] row [0 1]]
+                      (triangle-hull-seq
+                       (thumb-place column row web-post-bl)
+                       (thumb-place column row web-post-br)
+                       (thumb-place column (dec row) web-post-tl)
+                       (thumb-place column (dec row) web-post-tr))))
+
+             ;;Connecting the two doubles
+             (triangle-hull-seq (thumb-place 0 -1/2 thumb-tl)
+                                (thumb-place 0 -1/2 thumb-bl)
+                                (thumb-place 1 -1/2 thumb-tr)
+                                (thumb-place 1 -1/2 thumb-br))
+
+             ;;Connecting the middle double to the one above it
+             (triangle-hull-seq (thumb-place 1 -1/2 thumb-tr)
+                                (thumb-place 1 -1/2 thumb-tl)
+                                (thumb-place 1 1 web-post-br)
+                                (thumb-place 1 1 web-post-bl))
+
+             ;;Connecting the 3 singles in the top left with the middle double
+             (triangle-hull-seq (thumb-place 1 1 web-post-bl)
+                                (thumb-place 1 -1/2 thumb-tl)
+                                (thumb-place 2 1 web-post-br)
+                                (thumb-place 2 0 web-post-tr))
+
+             ;;Connecting the two singles in the lower left with the middle double
+             [(hull (thumb-place 1 -1/2 thumb-tl)
+                    (thumb-place 1 -1/2 thumb-bl)
+                    (thumb-place 2 0 web-post-br)
+                    (thumb-place 2 -1 web-post-tr))
+              (hull (thumb-place 1 -1/2 thumb-tl)
+                    (thumb-place 2 0 web-post-tr)
+                    (thumb-place 2 0 web-post-br))
+              (hull (thumb-place 1 -1/2 thumb-bl)
+                    (thumb-place 2 -1 web-post-tr)
+                    (thumb-place 2 -1 web-post-br))]
+
+             ;;Connecting the right double to the one above it
+             (triangle-hull-seq (thumb-place 0 -1/2 thumb-tr)
+                                (thumb-place 0 -1/2 thumb-tl)
+                                (thumb-place 0 1 web-post-br)
+                                (thumb-place 0 1 web-post-bl))
+
+             ;;Connecting the 2 singles in the top right with the 2 doubles
+             (triangle-hull-seq (thumb-place 0 1 web-post-bl)
+                                (thumb-place 0 -1/2 thumb-tl)
+                                (thumb-place 1 1 web-post-br)
+                                (thumb-place 1 -1/2 thumb-tr))
+
+             ;;Connecting the thumb to everything
+             ;(triangle-hull-seq (thumb-place 0 -1/2 thumb-br-clearance)
+             ;                   (key-place 1 4 web-post-bl)
+             ;                   (thumb-place 0 -1/2 thumb-tr-clearance)
+             ;                   (key-place 1 4 web-post-tl)
+             ;                   (key-place 1 3 web-post-bl)
+             ;                   (thumb-place 0 -1/2 thumb-tr-clearance)
+             ;                   (key-place 0 3 web-post-br)
+             ;                   (key-place 0 3 web-post-bl)
+             ;                   (thumb-place 0 -1/2 thumb-tr-clearance)
+             ;                   (key-place 0 3 web-post-tl)
+             ;                   (thumb-place 0 1 web-post-br-clearance)
+             ;                   (thumb-place 0 1 web-post-tr-clearance))
+             ;(hull (thumb-place 0 -1/2 thumb-edge-tr)
+             ;      (thumb-place 0 -1/2 thumb-edge-tr-clearance)
+             ;      (thumb-place 0 -1/2 thumb-edge-br-clearance)
+             ;      (thumb-place 0 -1/2 thumb-edge-br))
+             ;(hull (thumb-place 0 -1/2 thumb-edge-tr)
+             ;      (thumb-place 0 -1/2 thumb-edge-tr-clearance)
+             ;      (thumb-place 0 1 web-edge-br-clearance)
+             ;      (thumb-place 0 1 web-edge-br))
+             ;(hull (thumb-place 0 1 web-edge-tr)
+             ;      (thumb-place 0 1 web-edge-tr-clearance)
+             ;      (thumb-place 0 1 web-edge-br-clearance)
+             ;      (thumb-place 0 1 web-edge-br))
+             ))))
 
 (def thumb
   (union
@@ -515,38 +516,58 @@
 (defn scale-to-range [start end x]
   (+ start (* (- end start) x)))
 
-(defn wall-sphere-bottom [front-to-back-scale]
-  (wall-sphere-at [0
-                   (scale-to-range
-                    (+ (/ mount-height -2) -3.5)
-                    (+ (/ mount-height 2) 5.0)
-                    front-to-back-scale)
-                   -6]))
-
-(defn wall-sphere-top [front-to-back-scale]
-  (wall-sphere-at [0
-                   (scale-to-range
-                    (+ (/ mount-height -2) -3.5)
-                    (+ (/ mount-height 2) 3.5)
-                    front-to-back-scale)
-                   10]))
+; Memoized, since the walls ask for the same few spheres over and over
+(def wall-sphere-bottom
+  (memoize
+    (fn [front-to-back-scale]
+      (wall-sphere-at [0
+                       (scale-to-range
+                        (+ (/ mount-height -2) -3.5)
+                        (+ (/ mount-height 2) 5.0)
+                        front-to-back-scale)
+                       -6]))))
+
+(def wall-sphere-top
+  (memoize
+    (fn [front-to-back-scale]
+      (wall-sphere-at [0
+                       (scale-to-range
+                        (+ (/ mount-height -2) -3.5)
+                        (+ (/ mount-height 2) 3.5)
+                        front-to-back-scale)
+                       10]))))
 
 (def wall-sphere-top-back (wall-sphere-top 1))
 (def wall-sphere-bottom-back (wall-sphere-bottom 1))
 (def wall-sphere-bottom-front (wall-sphere-bottom 0))
 (def wall-sphere-top-front (wall-sphere-top 0))
 
+; The bottom wall spheres nudged up and in towards the keys, where the walls join the web posts
+(def wall-sphere-bottom-front-inset (translate [0 1 1] wall-sphere-bottom-front))
+(def wall-sphere-bottom-back-inset (translate [0 -1 1] wall-sphere-bottom-back))
+(def wall-sphere-bottom-back-left-inset (translate [1 0 1] wall-sphere-bottom-back))
+
+; Neighbouring cells of the cover share their corners, so the sphere is placed once per grid
+; point and each cell hulls the four placed corners around it.
 (defn top-case-cover [place-fn sphere
                  x-start x-end
                  y-start y-end
                  step]
-  (apply union
-         (for [x (range-inclusive x-start (- x-end step) step)
-               y (range-inclusive y-start (- y-end step) step)]
-           (hull (place-fn x y sphere)
-                 (place-fn (+ x step) y sphere)
-                 (place-fn x (+ y step) sphere)
-                 (place-fn (+ x step) (+ y step) sphere)))))
+  (let [grid-values (fn [start end]
+                      (let [values (range-inclusive start (- end step) step)]
+                        (vec (concat values [(+ (last values) step)]))))
+        xs (grid-values x-start x-end)
+        ys (grid-values y-start y-end)
+        corners (vec (for [x xs]
+                       (vec (for [y ys]
+                              (place-fn x y sphere)))))]
+    (balanced-union
+      (for [i (range (dec (count xs)))
+            j (range (dec (count ys)))]
+        (hull (get-in corners [i j])
+              (get-in corners [(inc i) j])
+              (get-in corners [i (inc j)])
+              (get-in corners [(inc i) (inc j)]))))))
 
 (defn curtain [offset & shapes]
   (hull
@@ -560,338 +581,298 @@
                     (top-case-cover case-place wall-sphere-top-front
                                     x-start x-end y-start y-end
                                     wall-step))]
-    (union
-     (apply union
-            (for [x (range-inclusive 0.7 (- right-wall-column step) step)]
-              (hull (case-place x 4 wall-sphere-top-front)
-                    (case-place (+ x step) 4 wall-sphere-top-front)
-                    (case-place x 4 wall-sphere-bottom-front)
-                    (case-place (+ x step) 4 wall-sphere-bottom-front))))
-     (apply union
-            (for [x (range-inclusive 0.5 0.7 0.01)]
-              (hull (case-place x 4 wall-sphere-top-front)
-                    (case-place (+ x step) 4 wall-sphere-top-front)
-                    (case-place 0.7 4 wall-sphere-bottom-front))))
-     (top-cover 0.5 1.7 3.6 4)
-     (top-cover 1.59 2.41 3.35 4) ;; was 3.32
-     (top-cover 2.39 3.41 3.6 4)
-     (apply union
-            (for [x (range 2 5)]
-              (union
-               (hull (case-place (- x 1/2) 4 (translate [0 1 1] wall-sphere-bottom-front))
-                     (case-place (+ x 1/2) 4 (translate [0 1 1] wall-sphere-bottom-front))
-                     (key-place x 4 web-post-bl)
-                     (key-place x 4 web-post-br))
-               (hull (case-place (- x 1/2) 4 (translate [0 1 1] wall-sphere-bottom-front))
-                     (key-place x 4 web-post-bl)
-                     (key-place (- x 1) 4 web-post-br)))))
-     (hull (case-place right-wall-column 4 (translate [0 1 1] wall-sphere-bottom-front))
-           (case-place (- right-wall-column 1) 4 (translate [0 1 1] wall-sphere-bottom-front))
-           (key-place 5 4 web-post-bl)
-           (key-place 5 4 web-post-br))
-     (hull (case-place (+ 4 1/2) 4 (translate [0 1 1] wall-sphere-bottom-front))
-           (case-place (- right-wall-column 1) 4 (translate [0 1 1] wall-sphere-bottom-front))
-           (key-place 4 4 web-post-br)
-           (key-place 5 4 web-post-bl))
-     (hull (case-place 0.7 4 (translate [0 1 1] wall-sphere-bottom-front))
-           (case-place 1.7 4 (translate [0 1 1] wall-sphere-bottom-front))
-           (key-place 1 4 web-post-bl)
-           (key-place 1 4 web-post-br))
-     ; Curtains (from bottom edge of walls to z=0):
-     (apply union
-            (for [x (range-inclusive 1.25 (- right-wall-column step) step)]
-              (curtain [0 0 -100]
-                (case-place x 4 (translate [-0.5 0.5 0.5] wall-sphere-bottom-front))
-                (case-place (+ x step) 4 (translate [-0.5 0.5 0.5] wall-sphere-bottom-front))
-                )))
-     )))
+    (balanced-union
+      (concat
+        (for [x (range-inclusive 0.7 (- right-wall-column step) step)]
+          (hull (case-place x 4 wall-sphere-top-front)
+                (case-place (+ x step) 4 wall-sphere-top-front)
+                (case-place x 4 wall-sphere-bottom-front)
+                (case-place (+ x step) 4 wall-sphere-bottom-front)))
+        (for [x (range-inclusive 0.5 0.7 0.01)]
+          (hull (case-place x 4 wall-sphere-top-front)
+                (case-place (+ x step) 4 wall-sphere-top-front)
+                (case-place 0.7 4 wall-sphere-bottom-front)))
+        [(top-cover 0.5 1.7 3.6 4)
+         (top-cover 1.59 2.41 3.35 4) ;; was 3.32
+         (top-cover 2.39 3.41 3.6 4)]
+        (mapcat (fn [x]
+                  [(hull (case-place (- x 1/2) 4 wall-sphere-bottom-front-inset)
+                         (case-place (+ x 1/2) 4 wall-sphere-bottom-front-inset)
+                         (key-place x 4 web-post-bl)
+                         (key-place x 4 web-post-br))
+                   (hull (case-place (- x 1/2) 4 wall-sphere-bottom-front-inset)
+                         (key-place x 4 web-post-bl)
+                         (key-place (- x 1) 4 web-post-br))])
+                (range 2 5))
+        [(hull (case-place right-wall-column 4 wall-sphere-bottom-front-inset)
+               (case-place (- right-wall-column 1) 4 wall-sphere-bottom-front-inset)
+               (key-place 5 4 web-post-bl)
+               (key-place 5 4 web-post-br))
+         (hull (case-place (+ 4 1/2) 4 wall-sphere-bottom-front-inset)
+               (case-place (- right-wall-column 1) 4 wall-sphere-bottom-front-inset)
+               (key-place 4 4 web-post-br)
+               (key-place 5 4 web-post-bl))
+         (hull (case-place 0.7 4 wall-sphere-bottom-front-inset)
+               (case-place 1.7 4 wall-sphere-bottom-front-inset)
+               (key-place 1 4 web-post-bl)
+               (key-place 1 4 web-post-br))]
+        ; Curtains (from bottom edge of walls to z=0):
+        (for [x (range-inclusive 1.25 (- right-wall-column step) step)]
+          (curtain [0 0 -100]
+            (case-place x 4 (translate [-0.5 0.5 0.5] wall-sphere-bottom-front))
+            (case-place (+ x step) 4 (translate [-0.5 0.5 0.5] wall-sphere-bottom-front))
+            ))))))
 
 (def back-wall
   (let [step wall-step
         wall-sphere-top-backtep 0.05
         front-top-cover (fn [x-start x-end y-start y-end]
-                          (apply union
-                                 (for [x (range-inclusive x-start (- x-end wall-sphere-top-backtep) wall-sphere-top-backtep)
-                                       y (range-inclusive y-start (- y-end wall-sphere-top-backtep) wall-sphere-top-backtep)]
-                                   (hull (case-place x y wall-sphere-top-back)
-                                         (case-place (+ x wall-sphere-top-backtep) y wall-sphere-top-back)
-                                         (case-place x (+ y wall-sphere-top-backtep) wall-sphere-top-back)
-                                         (case-place (+ x wall-sphere-top-backtep) (+ y wall-sphere-top-backtep) wall-sphere-top-back)))))]
-    (union
-     (apply union
-            (for [x (range-inclusive left-wall-column (- right-wall-column step) step)]
-              (hull (case-place x back-y wall-sphere-top-back)
-                    (case-place (+ x step) back-y wall-sphere-top-back)
-                    (case-place x back-y wall-sphere-bottom-back)
-                    (case-place (+ x step) back-y wall-sphere-bottom-back))))
-     (front-top-cover 1.56 2.44 back-y 0.1)
-     (front-top-cover 3.56 4.44 back-y 0.13)
-     (front-top-cover 4.3 right-wall-column back-y 0.13)
-
-
-     (hull (case-place left-wall-column 0 (translate [1 -1 1] wall-sphere-bottom-back))
-           (case-place (+ left-wall-column 1) 0  (translate [0 -1 1] wall-sphere-bottom-back))
-           (key-place 0 0 web-post-tl)
-           (key-place 0 0 web-post-tr))
-
-     (hull (case-place 5 0 (translate [0 -1 1] wall-sphere-bottom-back))
-           (case-place right-wall-column 0 (translate [0 -1 1] wall-sphere-bottom-back))
-           (key-place 5 0 web-post-tl)
-           (key-place 5 0 web-post-tr))
-
-     (apply union
-            (for [x (range 1 5)]
-              (union
-               (hull (case-place (- x 1/2) 0 (translate [0 -1 1] wall-sphere-bottom-back))
-                     (case-place (+ x 1/2) 0 (translate [0 -1 1] wall-sphere-bottom-back))
-                     (key-place x 0 web-post-tl)
-                     (key-place x 0 web-post-tr))
-               (hull (case-place (- x 1/2) 0 (translate [0 -1 1] wall-sphere-bottom-back))
-                     (key-place x 0 web-post-tl)
-                     (key-place (- x 1) 0 web-post-tr)))))
-     (hull (case-place (- 5 1/2) 0 (translate [0 -1 1] wall-sphere-bottom-back))
-           (case-place 5 0 (translate [0 -1 1] wall-sphere-bottom-back))
-           (key-place 4 0 web-post-tr)
-           (key-place 5 0 web-post-tl))
-
-     ; Curtains (from bottom edge of walls to z=0):
-     (curtain [0 25 -100]
-       (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))
-       (case-place (+ left-wall-column 1) 0  (translate [0 -0.75 0.5] wall-sphere-bottom-back)))
-     (hull
-       (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))
-       (translate [0 0 -100] (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back)))
-       (translate [0 25 -100] (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))))
-     (curtain [0 25 -100]
-       (case-place 5 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))
-       (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back)))
-     (hull
-       (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back))
-       (translate [0 0 -100] (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back)))
-       (translate [0 25 -100] (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back))))
-     (apply union
-            (for [x (range 1 5)]
-              (union
-                (curtain [0 25 -100]
-                  (case-place (- x 1/2) 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))
-                  (case-place (+ x 1/2) 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))))))
-     (curtain [0 25 -100]
-       (case-place (- 5 1/2) 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))
-       (case-place 5 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back)))
-     )))
+                          (top-case-cover case-place wall-sphere-top-back
+                                          x-start x-end y-start y-end
+                                          wall-sphere-top-backtep))]
+    (balanced-union
+      (concat
+        (for [x (range-inclusive left-wall-column (- right-wall-column step) step)]
+          (hull (case-place x back-y wall-sphere-top-back)
+                (case-place (+ x step) back-y wall-sphere-top-back)
+                (case-place x back-y wall-sphere-bottom-back)
+                (case-place (+ x step) back-y wall-sphere-bottom-back)))
+        [(front-top-cover 1.56 2.44 back-y 0.1)
+         (front-top-cover 3.56 4.44 back-y 0.13)
+         (front-top-cover 4.3 right-wall-column back-y 0.13)
+
+
+         (hull (case-place left-wall-column 0 (translate [1 -1 1] wall-sphere-bottom-back))
+               (case-place (+ left-wall-column 1) 0  wall-sphere-bottom-back-inset)
+               (key-place 0 0 web-post-tl)
+               (key-place 0 0 web-post-tr))
+
+         (hull (case-place 5 0 wall-sphere-bottom-back-inset)
+               (case-place right-wall-column 0 wall-sphere-bottom-back-inset)
+               (key-place 5 0 web-post-tl)
+               (key-place 5 0 web-post-tr))]
+
+        (mapcat (fn [x]
+                  [(hull (case-place (- x 1/2) 0 wall-sphere-bottom-back-inset)
+                         (case-place (+ x 1/2) 0 wall-sphere-bottom-back-inset)
+                         (key-place x 0 web-post-tl)
+                         (key-place x 0 web-post-tr))
+                   (hull (case-place (- x 1/2) 0 wall-sphere-bottom-back-inset)
+                         (key-place x 0 web-post-tl)
+                         (key-place (- x 1) 0 web-post-tr))])
+                (range 1 5))
+        [(hull (case-place (- 5 1/2) 0 wall-sphere-bottom-back-inset)
+               (case-place 5 0 wall-sphere-bottom-back-inset)
+               (key-place 4 0 web-post-tr)
+               (key-place 5 0 web-post-tl))
+
+         ; Curtains (from bottom edge of walls to z=0):
+         (curtain [0 25 -100]
+           (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))
+           (case-place (+ left-wall-column 1) 0  (translate [0 -0.75 0.5] wall-sphere-bottom-back)))
+         (hull
+           (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))
+           (translate [0 0 -100] (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back)))
+           (translate [0 25 -100] (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))))
+         (curtain [0 25 -100]
+           (case-place 5 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))
+           (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back)))
+         (hull
+           (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back))
+           (translate [0 0 -100] (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back)))
+           (translate [0 25 -100] (case-place right-wall-column 0 (translate [-0.5 -0.75 0.5] wall-sphere-bottom-back))))]
+        (for [x (range 1 5)]
+          (curtain [0 25 -100]
+            (case-place (- x 1/2) 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))
+            (case-place (+ x 1/2) 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))))
+        [(curtain [0 25 -100]
+           (case-place (- 5 1/2) 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back))
+           (case-place 5 0 (translate [0 -0.75 0.5] wall-sphere-bottom-back)))
+        ]))))
 
 (def right-wall
-  (union
-    (apply union
-           (map (partial apply hull)
-                (partition 2 1
-                           (for [scale (range-inclusive 0 1 0.01)]
-                             (let [x (scale-to-range 4 0.02 scale)]
-                               (hull (case-place right-wall-column x (wall-sphere-top scale))
-                                     (case-place right-wall-column x (wall-sphere-bottom scale))))))))
-
-    (apply union
-           (concat
-             (for [x (range 0 5)]
-               (union
-                 (hull (case-place right-wall-column x (translate [-1 0 1] (wall-sphere-bottom 1/2)))
-                       (key-place 5 x web-post-br)
-                       (key-place 5 x web-post-tr))))
-             (for [x (range 0 4)]
-               (union
-                 (hull (case-place right-wall-column x (translate [-1 0 1] (wall-sphere-bottom 1/2)))
-                       (case-place right-wall-column (inc x) (translate [-1 0 1] (wall-sphere-bottom 1/2)))
-                       (key-place 5 x web-post-br)
-                       (key-place 5 (inc x) web-post-tr))))
-             [(union
-                (hull (case-place right-wall-column 0 (translate [-1 0 1] (wall-sphere-bottom 1/2)))
-                      (case-place right-wall-column 0.02 (translate [-1 -1 1] (wall-sphere-bottom 1)))
-                      (key-place 5 0 web-post-tr))
-                (hull (case-place right-wall-column 4 (translate [-1 0 1] (wall-sphere-bottom 1/2)))
-                      (case-place right-wall-column 4 (translate [-1 1 1] (wall-sphere-bottom 0)))
-                      (key-place 5 4 web-post-br)))]))
-    ; Curtains (from bottom edge of walls to z=0):
-    (apply union
-           (concat
-             (for [x (range 0 4)]
-               (union
-                 (curtain [0 0 -100]
-                          (case-place right-wall-column x (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))
-                          (case-place right-wall-column (inc x) (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2))))
-                 ))
-             [(union
-                (curtain [0 0 -100]
-                         (case-place right-wall-column 0 (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))
-                         (case-place right-wall-column 0.02 (translate [-0.5 -0.5 0.5] (wall-sphere-bottom 1))))
-                (curtain [0 0 -100]
-                         (case-place right-wall-column 4 (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))
-                         (case-place right-wall-column 4 (translate [-0.5 0.5 0.5] (wall-sphere-bottom 0))))
-                )]))
-    ))
+  (balanced-union
+    (concat
+      ; Each wall segment is a single hull of the top and bottom spheres at both of its ends
+      (let [ends (vec (for [scale (range-inclusive 0 1 0.01)]
+                        (let [x (scale-to-range 4 0.02 scale)]
+                          [(case-place right-wall-column x (wall-sphere-top scale))
+                           (case-place right-wall-column x (wall-sphere-bottom scale))])))]
+        (for [i (range (dec (count ends)))]
+          (apply hull (concat (ends i) (ends (inc i))))))
+
+      (for [x (range 0 5)]
+        (hull (case-place right-wall-column x (translate [-1 0 1] (wall-sphere-bottom 1/2)))
+              (key-place 5 x web-post-br)
+              (key-place 5 x web-post-tr)))
+      (for [x (range 0 4)]
+        (hull (case-place right-wall-column x (translate [-1 0 1] (wall-sphere-bottom 1/2)))
+              (case-place right-wall-column (inc x) (translate [-1 0 1] (wall-sphere-bottom 1/2)))
+              (key-place 5 x web-post-br)
+              (key-place 5 (inc x) web-post-tr)))
+      [(hull (case-place right-wall-column 0 (translate [-1 0 1] (wall-sphere-bottom 1/2)))
+             (case-place right-wall-column 0.02 (translate [-1 -1 1] (wall-sphere-bottom 1)))
+             (key-place 5 0 web-post-tr))
+       (hull (case-place right-wall-column 4 (translate [-1 0 1] (wall-sphere-bottom 1/2)))
+             (case-place right-wall-column 4 (translate [-1 1 1] (wall-sphere-bottom 0)))
+             (key-place 5 4 web-post-br))]
+
+      ; Curtains (from bottom edge of walls to z=0):
+      (for [x (range 0 4)]
+        (curtain [0 0 -100]
+                 (case-place right-wall-column x (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))
+                 (case-place right-wall-column (inc x) (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))))
+      [(curtain [0 0 -100]
+                (case-place right-wall-column 0 (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))
+                (case-place right-wall-column 0.02 (translate [-0.5 -0.5 0.5] (wall-sphere-bottom 1))))
+       (curtain [0 0 -100]
+                (case-place right-wall-column 4 (translate [-0.5 0 0.5] (wall-sphere-bottom 1/2)))
+                (case-place right-wall-column 4 (translate [-0.5 0.5 0.5] (wall-sphere-bottom 0))))])))
 
 (def left-wall
-  (let [web-post-tr-clearance (->> web-post-tr
-                                   (translate [0 0 (- web-thickness thumb-switch-clearance)]))]
-    (union
-     (apply union
-            (for [x (range-inclusive -1 (- 1.6666 wall-step) wall-step)]
-              (hull (case-place left-wall-column x wall-sphere-top-front)
-                    (case-place left-wall-column (+ x wall-step) wall-sphere-top-front)
-                    (case-place left-wall-column x wall-sphere-bottom-front)
-                    (case-place left-wall-column (+ x wall-step) wall-sphere-bottom-front))))
-     (hull (case-place left-wall-column -1 wall-sphere-top-front)
-           (case-place left-wall-column -1 wall-sphere-bottom-front)
-           (case-place left-wall-column 0.02 wall-sphere-top-back)
-           (case-place left-wall-column 0.02 wall-sphere-bottom-back))
-     (hull (case-place left-wall-column 0 (translate [1 -1 1] wall-sphere-bottom-back))
-           (case-place left-wall-column 1 (translate [1 0 1] wall-sphere-bottom-back))
-           (key-place 0 0 web-post-tl)
-           (key-place 0 0 web-post-bl))
-     (hull (case-place left-wall-column 1 (translate [1 0 1] wall-sphere-bottom-back))
-           (case-place left-wall-column 2 (translate [1 0 1] wall-sphere-bottom-back))
-           (key-place 0 0 web-post-bl)
-           (key-place 0 1 web-post-bl))
-     (hull (case-place left-wall-column 2 (translate [1 0 1] wall-sphere-bottom-back))
-           (case-place left-wall-column 1.6666  (translate [1 0 1] wall-sphere-bottom-front))
-           (key-place 0 1 web-post-bl)
-           (key-place 0 2 web-post-bl))
-     (hull (case-place left-wall-column 1.6666  (translate [1 0 1] wall-sphere-bottom-front))
-           (key-place 0 2 web-post-bl)
-           (key-place 0 3 web-post-tl))
-     (hull (case-place left-wall-column 1.6666  (translate [1 0 1] wall-sphere-bottom-front))
-           (thumb-place 0 1 web-post-tr-clearance)
-           (key-place 0 3 web-post-tl))
-     (hull (case-place left-wall-column 1.6666 (translate [1 0 1] wall-sphere-bottom-front))
-           (thumb-place 0 1 web-post-tr-clearance)
-           (thumb-place -1/2 thumb-back-y (translate [0 -1 1] wall-sphere-bottom-back)))
-     ; Curtains (from bottom edge of walls to z=0):
-     (curtain [0 0 -100]
-       (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))
-       (case-place left-wall-column 1 (translate [0.5 0 0.5] wall-sphere-bottom-back)))
-     (curtain [0 0 -100]
-       (case-place left-wall-column 1 (translate [0.5 0 0.5] wall-sphere-bottom-back))
-       (case-place left-wall-column 2 (translate [0.5 0 0.5] wall-sphere-bottom-back)))
-     (curtain [0 0 -100]
-       (case-place left-wall-column 2 (translate [0.5 0 0.5] wall-sphere-bottom-back))
-       (case-place left-wall-column 1.6666  (translate [0.5 0 0.5] wall-sphere-bottom-front)))
-     )))
+  (balanced-union
+    (concat
+      (for [x (range-inclusive -1 (- 1.6666 wall-step) wall-step)]
+        (hull (case-place left-wall-column x wall-sphere-top-front)
+              (case-place left-wall-column (+ x wall-step) wall-sphere-top-front)
+              (case-place left-wall-column x wall-sphere-bottom-front)
+              (case-place left-wall-column (+ x wall-step) wall-sphere-bottom-front)))
+      [(hull (case-place left-wall-column -1 wall-sphere-top-front)
+             (case-place left-wall-column -1 wall-sphere-bottom-front)
+             (case-place left-wall-column 0.02 wall-sphere-top-back)
+             (case-place left-wall-column 0.02 wall-sphere-bottom-back))
+       (hull (case-place left-wall-column 0 (translate [1 -1 1] wall-sphere-bottom-back))
+             (case-place left-wall-column 1 wall-sphere-bottom-back-left-inset)
+             (key-place 0 0 web-post-tl)
+             (key-place 0 0 web-post-bl))
+       (hull (case-place left-wall-column 1 wall-sphere-bottom-back-left-inset)
+             (case-place left-wall-column 2 wall-sphere-bottom-back-left-inset)
+             (key-place 0 0 web-post-bl)
+             (key-place 0 1 web-post-bl))
+       (hull (case-place left-wall-column 2 wall-sphere-bottom-back-left-inset)
+             (case-place left-wall-column 1.6666  (translate [1 0 1] wall-sphere-bottom-front))
+             (key-place 0 1 web-post-bl)
+             (key-place 0 2 web-post-bl))
+       (hull (case-place left-wall-column 1.6666  (translate [1 0 1] wall-sphere-bottom-front))
+             (key-place 0 2 web-post-bl)
+             (key-place 0 3 web-post-tl))
+       (hull (case-place left-wall-column 1.6666  (translate [1 0 1] wall-sphere-bottom-front))
+             (thumb-place 0 1 web-post-tr-clearance)
+             (key-place 0 3 web-post-tl))
+       (hull (case-place left-wall-column 1.6666 (translate [1 0 1] wall-sphere-bottom-front))
+             (thumb-place 0 1 web-post-tr-clearance)
+             (thumb-place -1/2 thumb-back-y wall-sphere-bottom-back-inset))
+       ; Curtains (from bottom edge of walls to z=0):
+       (curtain [0 0 -100]
+         (case-place left-wall-column 0 (translate [0.5 -0.75 0.5] wall-sphere-bottom-back))
+         (case-place left-wall-column 1 (translate [0.5 0 0.5] wall-sphere-bottom-back)))
+       (curtain [0 0 -100]
+         (case-place left-wall-column 1 (translate [0.5 0 0.5] wall-sphere-bottom-back))
+         (case-place left-wall-column 2 (translate [0.5 0 0.5] wall-sphere-bottom-back)))
+       (curtain [0 0 -100]
+         (case-place left-wall-column 2 (translate [0.5 0 0.5] wall-sphere-bottom-back))
+         (case-place left-wall-column 1.6666  (translate [0.5 0 0.5] wall-sphere-bottom-front)))
+      ])))
 
 (def thumb-back-wall
   (let [step wall-step
         top-step 0.05
         front-top-cover (fn [x-start x-end y-start y-end]
-                          (apply union
-                                 (for [x (range-inclusive x-start (- x-end top-step) top-step)
-                                       y (range-inclusive y-start (- y-end top-step) top-step)]
-                                   (hull (thumb-place x y wall-sphere-top-back)
-                                         (thumb-place (+ x top-step) y wall-sphere-top-back)
-                                         (thumb-place x (+ y top-step) wall-sphere-top-back)
-                                         (thumb-place (+ x top-step) (+ y top-step) wall-sphere-top-back)))))
-        web-post-tr-clearance (->> web-post-tr
-                                   (translate [0 0 (- web-thickness thumb-switch-clearance)]))
+                          (top-case-cover thumb-place wall-sphere-top-back
+                                          x-start x-end y-start y-end
+                                          top-step))
         back-y thumb-back-y]
-    (union
-     (apply union
-            (for [x (range-inclusive thumb-right-wall-column (- (+ 5/2 0.05) step) step)]
-              (union
-                (hull (thumb-place x back-y wall-sphere-top-back)
-                      (thumb-place (+ x step) back-y wall-sphere-top-back)
-                      (thumb-place x back-y wall-sphere-bottom-back)
-                      (thumb-place (+ x step) back-y wall-sphere-bottom-back))
-                (hull (thumb-place x back-y wall-sphere-bottom-back)
-                      (thumb-place (+ x step) back-y wall-sphere-bottom-back)
-                      (case-place left-wall-column 1.6666 wall-sphere-bottom-front))
-              )))
-     (hull
-       (thumb-place thumb-right-wall-column back-y wall-sphere-bottom-back)
-       (case-place left-wall-column 1.6666 wall-sphere-top-front)
-       (case-place left-wall-column 1.6666 wall-sphere-bottom-front))
-     (hull
-      (thumb-place -1/2 thumb-back-y (translate [0 -1 1] wall-sphere-bottom-back))
-      (thumb-place 0 1 web-post-tr)
-      (thumb-place 0 1 web-post-tr-clearance)
-      (thumb-place 1/2 thumb-back-y (translate [0 -1 1] wall-sphere-bottom-back))
-      (thumb-place 0 1 web-post-tl))
-     (hull
-      (thumb-place (+ 5/2 0.05) thumb-back-y (translate [1 -1 1] wall-sphere-bottom-back))
-      (thumb-place 3/2 thumb-back-y (translate [0 -1 1] wall-sphere-bottom-back))
-      (thumb-place 1 1 web-post-tl)
-      (thumb-place 2 1 web-post-tl))
-     (hull
-      (thumb-place (+ 3/2 0.05) thumb-back-y (translate [1 -1 1] wall-sphere-bottom-back))
-      (thumb-place 1/2 thumb-back-y (translate [0 -1 1] wall-sphere-bottom-back))
-      (thumb-place 0 1 web-post-tl)
-      (thumb-place 1 1 web-post-tl))
-     ; Curtains (from bottom edge of walls to z=0):
-     (curtain [0 0 -100]
-       (thumb-place (+ 5/2 0.05) thumb-back-y wall-sphere-bottom-back)
-       (case-place left-wall-column 1.6666 (translate [0.5 0 0.5] wall-sphere-bottom-front)))
-     (curtain [0 0 -100]
-       (thumb-place (+ 5/2 0.05) thumb-back-y wall-sphere-bottom-back)
-       (thumb-place (+ 5/2 0.05) thumb-back-y wall-sphere-top-back))
-     )))
+    (balanced-union
+      (concat
+        (mapcat (fn [x]
+                  [(hull (thumb-place x back-y wall-sphere-top-back)
+                         (thumb-place (+ x step) back-y wall-sphere-top-back)
+                         (thumb-place x back-y wall-sphere-bottom-back)
+                         (thumb-place (+ x step) back-y wall-sphere-bottom-back))
+                   (hull (thumb-place x back-y wall-sphere-bottom-back)
+                         (thumb-place (+ x step) back-y wall-sphere-bottom-back)
+                         (case-place left-wall-column 1.6666 wall-sphere-bottom-front))])
+                (range-inclusive thumb-right-wall-column (- (+ 5/2 0.05) step) step))
+        [(hull
+           (thumb-place thumb-right-wall-column back-y wall-sphere-bottom-back)
+           (case-place left-wall-column 1.6666 wall-sphere-top-front)
+           (case-place left-wall-column 1.6666 wall-sphere-bottom-front))
+         (hull
+          (thumb-place -1/2 thumb-back-y wall-sphere-bottom-back-inset)
+          (thumb-place 0 1 web-post-tr)
+          (thumb-place 0 1 web-post-tr-clearance)
+          (thumb-place 1/2 thumb-back-y wall-sphere-bottom-back-inset)
+          (thumb-place 0 1 web-post-tl))
+         (hull
+          (thumb-place (+ 5/2 0.05) thumb-back-y (translate [1 -1 1] wall-sphere-bottom-back))
+          (thumb-place 3/2 thumb-back-y wall-sphere-bottom-back-inset)
+          (thumb-place 1 1 web-post-tl)
+          (thumb-place 2 1 web-post-tl))
+         (hull
+          (thumb-place (+ 3/2 0.05) thumb-back-y (translate [1 -1 1] wall-sphere-bottom-back))
+          (thumb-place 1/2 thumb-back-y wall-sphere-bottom-back-inset)
+          (thumb-place 0 1 web-post-tl)
+          (thumb-place 1 1 web-post-tl))
+         ; Curtains (from bottom edge of walls to z=0):
+         (curtain [0 0 -100]
+           (thumb-place (+ 5/2 0.05) thumb-back-y wall-sphere-bottom-back)
+           (case-place left-wall-column 1.6666 (translate [0.5 0 0.5] wall-sphere-bottom-front)))
+         (curtain [0 0 -100]
+           (thumb-place (+ 5/2 0.05) thumb-back-y wall-sphere-bottom-back)
+           (thumb-place (+ 5/2 0.05) thumb-back-y wall-sphere-top-back))
+        ]))))
 
 (def thumb-left-wall
   (let [step wall-step]
-    (union
-     (apply union
-            (for [x (range-inclusive (+ -1 0.07) (- 1.95 step) step)]
-              (union
-                (hull (thumb-place thumb-left-wall-column x wall-sphere-top-front)
-                      (thumb-place thumb-left-wall-column (+ x step) wall-sphere-top-front)
-                      (thumb-place thumb-left-wall-column x wall-sphere-bottom-front)
-                      (thumb-place thumb-left-wall-column (+ x step) wall-sphere-bottom-front))
-                ; Curtains (from bottom edge of walls to z=0):
-                (curtain [0 0 -100]
-                         (thumb-place thumb-left-wall-column x wall-sphere-top-front)
-                         (thumb-place thumb-left-wall-column (+ x step) wall-sphere-top-front))
-                )))
-     (hull (thumb-place thumb-left-wall-column 1.95 wall-sphere-top-front)
-           (thumb-place thumb-left-wall-column 1.95 wall-sphere-bottom-front)
-           (thumb-place thumb-left-wall-column thumb-back-y wall-sphere-top-back)
-           (thumb-place thumb-left-wall-column thumb-back-y wall-sphere-bottom-back))
-     ; Curtains (from bottom edge of walls to z=0):
-     (curtain [0 0 -100]
-              (thumb-place thumb-left-wall-column 1.95 wall-sphere-top-front)
-              (thumb-place thumb-left-wall-column thumb-back-y wall-sphere-top-back))
-
-     (hull
-      (thumb-place thumb-left-wall-column thumb-back-y (translate [1 -1 1] wall-sphere-bottom-back))
-      (thumb-place thumb-left-wall-column 0 (translate [1 0 1] wall-sphere-bottom-back))
-      (thumb-place 2 1 web-post-tl)
-      (thumb-place 2 1 web-post-bl))
-     (hull
-      (thumb-place thumb-left-wall-column 0 (translate [1 0 1] wall-sphere-bottom-back))
-      (thumb-place 2 0 web-post-tl)
-      (thumb-place 2 1 web-post-bl))
-     (hull
-      (thumb-place thumb-left-wall-column 0 (translate [1 0 1] wall-sphere-bottom-back))
-      (thumb-place thumb-left-wall-column -1 (translate [1 0 1] wall-sphere-bottom-back))
-      (thumb-place 2 0 web-post-tl)
-      (thumb-place 2 0 web-post-bl))
-     (hull
-      (thumb-place thumb-left-wall-column -1 (translate [1 0 1] wall-sphere-bottom-back))
-      (thumb-place 2 -1 web-post-tl)
-      (thumb-place 2 0 web-post-bl))
-     (hull
-      (thumb-place thumb-left-wall-column -1 (translate [1 0 1] wall-sphere-bottom-back))
-      (thumb-place thumb-left-wall-column (+ -1 0.07) (translate [1 1 1] wall-sphere-bottom-front))
-      (thumb-place 2 -1 web-post-tl)
-      (thumb-place 2 -1 web-post-bl))
-     )))
+    (balanced-union
+      (concat
+        (mapcat (fn [x]
+                  [(hull (thumb-place thumb-left-wall-column x wall-sphere-top-front)
+                         (thumb-place thumb-left-wall-column (+ x step) wall-sphere-top-front)
+                         (thumb-place thumb-left-wall-column x wall-sphere-bottom-front)
+                         (thumb-place thumb-left-wall-column (+ x step) wall-sphere-bottom-front))
+                   ; Curtains (from bottom edge of walls to z=0):
+                   (curtain [0 0 -100]
+                            (thumb-place thumb-left-wall-column x wall-sphere-top-front)
+                            (thumb-place thumb-left-wall-column (+ x step) wall-sphere-top-front))])
+                (range-inclusive (+ -1 0.07) (- 1.95 step) step))
+        [(hull (thumb-place thumb-left-wall-column 1.95 wall-sphere-top-front)
+               (thumb-place thumb-left-wall-column 1.95 wall-sphere-bottom-front)
+               (thumb-place thumb-left-wall-column thumb-back-y wall-sphere-top-back)
+               (thumb-place thumb-left-wall-column thumb-back-y wall-sphere-bottom-back))
+         ; Curtains (from bottom edge of walls to z=0):
+         (curtain [0 0 -100]
+                  (thumb-place thumb-left-wall-column 1.95 wall-sphere-top-front)
+                  (thumb-place thumb-left-wall-column thumb-back-y wall-sphere-top-back))
+
+         (hull
+          (thumb-place thumb-left-wall-column thumb-back-y (translate [1 -1 1] wall-sphere-bottom-back))
+          (thumb-place thumb-left-wall-column 0 wall-sphere-bottom-back-left-inset)
+          (thumb-place 2 1 web-post-tl)
+          (thumb-place 2 1 web-post-bl))
+         (hull
+          (thumb-place thumb-left-wall-column 0 wall-sphere-bottom-back-left-inset)
+          (thumb-place 2 0 web-post-tl)
+          (thumb-place 2 1 web-post-bl))
+         (hull
+          (thumb-place thumb-left-wall-column 0 wall-sphere-bottom-back-left-inset)
+          (thumb-place thumb-left-wall-column -1 wall-sphere-bottom-back-left-inset)
+          (thumb-place 2 0 web-post-tl)
+          (thumb-place 2 0 web-post-bl))
+         (hull
+          (thumb-place thumb-left-wall-column -1 wall-sphere-bottom-back-left-inset)
+          (thumb-place 2 -1 web-post-tl)
+          (thumb-place 2 0 web-post-bl))
+         (hull
+          (thumb-place thumb-left-wall-column -1 wall-sphere-bottom-back-left-inset)
+          (thumb-place thumb-left-wall-column (+ -1 0.07) (translate [1 1 1] wall-sphere-bottom-front))
+          (thumb-place 2 -1 web-post-tl)
+          (thumb-place 2 -1 web-post-bl))
+        ]))))
 
 (def thumb-front-wall
   (let [step wall-step ;;0.1
         wall-sphere-top-fronttep 0.05 ;;0.05
-        plate-height (/ (- sa-double-length mount-height) 2)
-        thumb-tl (->> web-post-tl
-                      (translate [0 plate-height 0]))
-        thumb-bl (->> web-post-bl
-                      (translate [0 (- plate-height) 0]))
-        thumb-tr (->> web-post-tr
-                      (translate [-0 plate-height 0]))
-        thumb-br (->> web-post-br
-                      (translate [-0 (- plate-height) 0]))
         thumb-place-bottom (fn [column row shape]
                              (thumb-place
                                column
@@ -899,49 +880,43 @@
                                (translate
                                  [0 0 (* (math/expt (min 0 (- column 1 thumb-right-wall-column)) 2) thumb-corner-round-amount)]
                                  shape)))]
-    (union
-     (apply union
-            (for [x (range-inclusive thumb-right-wall-column (- thumb-left-wall-column step) step)]
-              (hull (thumb-place x thumb-front-row wall-sphere-top-front)
-                    (thumb-place (+ x step) thumb-front-row wall-sphere-top-front)
-                    (thumb-place-bottom x thumb-front-row wall-sphere-bottom-front)
-                    (thumb-place-bottom (+ x step) thumb-front-row wall-sphere-bottom-front))))
-
-     (hull (thumb-place-bottom (+ 5/2 0.05) thumb-front-row (translate [1 1 1] wall-sphere-bottom-front))
-           (thumb-place-bottom (+ 3/2 0.05) thumb-front-row (translate [0 1 1] wall-sphere-bottom-front))
-           (thumb-place 2 -1 web-post-bl)
-           (thumb-place 2 -1 web-post-br))
-
-     (hull (translate [0 0 -0.5] (thumb-place-bottom thumb-right-wall-column thumb-front-row (translate [0 1 1] wall-sphere-bottom-front)))
-           (thumb-place-bottom (+ 1/2 0.05) thumb-front-row (translate [0 1 1] wall-sphere-bottom-front))
-           (thumb-place 0 -1/2 thumb-bl)
-           (thumb-place 0 -1/2 thumb-br))
-     (hull (thumb-place-bottom (+ 1/2 0.05) thumb-front-row (translate [0 1 1] wall-sphere-bottom-front))
-           (thumb-place-bottom (+ 3/2 0.05) thumb-front-row (translate [0 1 1] wall-sphere-bottom-front))
-           (thumb-place 0 -1/2 thumb-bl)
-           (thumb-place 1 -1/2 thumb-bl)
-           (thumb-place 1 -1/2 thumb-br)
-           (thumb-place 2 -1 web-post-br))
-     ; Curtains (from bottom edge of walls to z=0):
-     (curtain [0 0 -100]
-       (translate [0 0 -0.5] (thumb-place-bottom thumb-left-wall-column (+ -1 0.07) wall-sphere-bottom-front))
-       (translate [0 0 -0.5] (thumb-place-bottom thumb-left-wall-column (+ -1 0.07) wall-sphere-top-front)))
-     (let [curtain-range-min 1.1
-           curtain-range-max (- (+ 5/2 0.05) step)]
-       (apply union
-              (for [x (range-inclusive curtain-range-min curtain-range-max step)]
-                (curtain [0 0 -100]
-                         (translate [0 (/ (- (+ curtain-range-max step) x) 5) -0.5] (thumb-place-bottom x (+ -1 0.07) wall-sphere-bottom-front))
-                         (translate [0 (/ (- curtain-range-max x) 5) -0.5] (thumb-place-bottom (+ x step) (+ -1 0.07) wall-sphere-bottom-front))))))
-     )))
+    (balanced-union
+      (concat
+        (for [x (range-inclusive thumb-right-wall-column (- thumb-left-wall-column step) step)]
+          (hull (thumb-place x thumb-front-row wall-sphere-top-front)
+                (thumb-place (+ x step) thumb-front-row wall-sphere-top-front)
+                (thumb-place-bottom x thumb-front-row wall-sphere-bottom-front)
+                (thumb-place-bottom (+ x step) thumb-front-row wall-sphere-bottom-front)))
+
+        [(hull (thumb-place-bottom (+ 5/2 0.05) thumb-front-row (translate [1 1 1] wall-sphere-bottom-front))
+               (thumb-place-bottom (+ 3/2 0.05) thumb-front-row wall-sphere-bottom-front-inset)
+               (thumb-place 2 -1 web-post-bl)
+               (thumb-place 2 -1 web-post-br))
+
+         (hull (translate [0 0 -0.5] (thumb-place-bottom thumb-right-wall-column thumb-front-row wall-sphere-bottom-front-inset))
+               (thumb-place-bottom (+ 1/2 0.05) thumb-front-row wall-sphere-bottom-front-inset)
+               (thumb-place 0 -1/2 thumb-bl)
+               (thumb-place 0 -1/2 thumb-br))
+         (hull (thumb-place-bottom (+ 1/2 0.05) thumb-front-row wall-sphere-bottom-front-inset)
+               (thumb-place-bottom (+ 3/2 0.05) thumb-front-row wall-sphere-bottom-front-inset)
+               (thumb-place 0 -1/2 thumb-bl)
+               (thumb-place 1 -1/2 thumb-bl)
+               (thumb-place 1 -1/2 thumb-br)
+               (thumb-place 2 -1 web-post-br))
+         ; Curtains (from bottom edge of walls to z=0):
+         (curtain [0 0 -100]
+           (translate [0 0 -0.5] (thumb-place-bottom thumb-left-wall-column (+ -1 0.07) wall-sphere-bottom-front))
+           (translate [0 0 -0.5] (thumb-place-bottom thumb-left-wall-column (+ -1 0.07) wall-sphere-top-front)))]
+        (let [curtain-range-min 1.1
+              curtain-range-max (- (+ 5/2 0.05) step)]
+          (for [x (range-inclusive curtain-range-min curtain-range-max step)]
+            (curtain [0 0 -100]
+                     (translate [0 (/ (- (+ curtain-range-max step) x) 5) -0.5] (thumb-place-bottom x (+ -1 0.07) wall-sphere-bottom-front))
+                     (translate [0 (/ (- curtain-range-max x) 5) -0.5] (thumb-place-bottom (+ x step) (+ -1 0.07) wall-sphere-bottom-front)))))
+        ))))
 
 (def thumb-right-wall
   (let [step wall-step
-        plate-height (/ (- sa-double-length mount-height) 2)
-        thumb-tr (->> web-post-tr
-                      (translate [0 plate-height 0]))
-        thumb-br (->> web-post-br
-                      (translate [0 (- plate-height) 0]))
         thumb-place-bottom (fn [column row shape]
                              (thumb-place
                                column
@@ -949,49 +924,53 @@
                                (translate
                                  [0 0 (* (math/expt (min 0 (- row 1 thumb-front-row)) 2) thumb-corner-round-amount)]
                                  shape)))]
-    (union
-     (apply union
-            (for [x (range-inclusive thumb-front-row (- 1.95 step) step)]
-              (hull (thumb-place thumb-right-wall-column x wall-sphere-top-front)
-                    (thumb-place thumb-right-wall-column (+ x step) wall-sphere-top-front)
-                    (thumb-place-bottom thumb-right-wall-column x wall-sphere-bottom-front)
-                    (thumb-place-bottom thumb-right-wall-column (+ x step) wall-sphere-bottom-front))
-              ))
-     (hull (thumb-place thumb-right-wall-column 1.95 wall-sphere-top-front)
-           (thumb-place thumb-right-wall-column thumb-back-y wall-sphere-top-back)
-           (thumb-place-bottom thumb-right-wall-column 1.95 wall-sphere-bottom-front)
-           (thumb-place-bottom thumb-right-wall-column thumb-back-y wall-sphere-bottom-back))
-
-     (hull
-      (thumb-place-bottom thumb-right-wall-column thumb-back-y (translate [-1 -1 1] wall-sphere-bottom-back))
-      (thumb-place-bottom thumb-right-wall-column 0 (translate [-1 0 1] wall-sphere-bottom-back))
-      (thumb-place 0 1 web-post-tr)
-      (thumb-place 0 1 web-post-br))
-     (hull
-      (thumb-place-bottom thumb-right-wall-column 0 (translate [-1 0 1] wall-sphere-bottom-back))
-      (thumb-place 0 -1/2 thumb-tr)
-      (thumb-place 0 1 web-post-br))
-     (hull
-      (thumb-place-bottom thumb-right-wall-column 0 (translate [-1 0 1] wall-sphere-bottom-back))
-      (thumb-place-bottom thumb-right-wall-column (+ -1 0.07) (translate [-1 1 1] wall-sphere-bottom-front))
-      (thumb-place 0 -1/2 thumb-tr)
-      (thumb-place 0 -1/2 thumb-br))
-     )))
+    (balanced-union
+      (concat
+        (for [x (range-inclusive thumb-front-row (- 1.95 step) step)]
+          (hull (thumb-place thumb-right-wall-column x wall-sphere-top-front)
+                (thumb-place thumb-right-wall-column (+ x step) wall-sphere-top-front)
+                (thumb-place-bottom thumb-right-wall-column x wall-sphere-bottom-front)
+                (thumb-place-bottom thumb-right-wall-column (+ x step) wall-sphere-bottom-front)))
+        [(hull (thumb-place thumb-right-wall-column 1.95 wall-sphere-top-front)
+               (thumb-place thumb-right-wall-column thumb-back-y wall-sphere-top-back)
+               (thumb-place-bottom thumb-right-wall-column 1.95 wall-sphere-bottom-front)
+               (thumb-place-bottom thumb-right-wall-column thumb-back-y wall-sphere-bottom-back))
+
+         (hull
+          (thumb-place-bottom thumb-right-wall-column thumb-back-y (translate [-1 -1 1] wall-sphere-bottom-back))
+          (thumb-place-bottom thumb-right-wall-column 0 (translate [-1 0 1] wall-sphere-bottom-back))
+          (thumb-place 0 1 web-post-tr)
+          (thumb-place 0 1 web-post-br))
+         (hull
+          (thumb-place-bottom thumb-right-wall-column 0 (translate [-1 0 1] wall-sphere-bottom-back))
+          (thumb-place 0 -1/2 thumb-tr)
+          (thumb-place 0 1 web-post-br))
+         (hull
+          (thumb-place-bottom thumb-right-wall-column 0 (translate [-1 0 1] wall-sphere-bottom-back))
+          (thumb-place-bottom thumb-right-wall-column (+ -1 0.07) (translate [-1 1 1] wall-sphere-bottom-front))
+          (thumb-place 0 -1/2 thumb-tr)
+          (thumb-place 0 -1/2 thumb-br))
+        ]))))
 
 (def new-case
-  (union front-wall
-         right-wall
-         back-wall
-         left-wall
-         thumb-back-wall
-         thumb-left-wall
-         thumb-front-wall
-         thumb-right-wall))
+  (balanced-union [front-wall
+                   right-wall
+                   back-wall
+                   left-wall
+                   thumb-back-wall
+                   thumb-left-wall
+                   thumb-front-wall
+                   thumb-right-wall]))
+
+; Everything below z=0, for trimming parts down to the floor
+(def below-floor
+  (->> (cube 1000 1000 100) (translate [0 0 -50])))
 
 (def new-case-trimmed
-  (difference
-    new-case
-    (->> (cube 1000 1000 100) (translate [0 0 -50]))))
+  (cached-stl "new-case-trimmed"
+              (difference
+                new-case
+                below-floor)))
 
 ;;;;;;;;;;;;;;;;;;;;
 ;; IBM TrackPoint ;;
@@ -1006,44 +985,51 @@
   (color
     [1 0 0]
     (binding [*fs* 0.5]
-                 (union
-                   (cylinder trackpoint-stem-hole-radius (* thickness 3))
-                   (translate [trackpoint-screw-hole-offset 0 0]
-                              (cylinder hole-radius (* thickness 3)))
-                   (translate [(- trackpoint-screw-hole-offset) 0 0]
-                              (cylinder hole-radius (* thickness 3)))
-                   (translate [0 (- (/ 37 2) 8) (- -2.5 thickness)] (cube 27 37 5))
-                   ))))
+                 ; An even number of facets, so that the hole is unchanged by the mirror below
+                 (let [screw-hole (translate [trackpoint-screw-hole-offset 0 0]
+                                             (with-fn 24 (cylinder hole-radius (* thickness 3))))]
+                   (union
+                     (cylinder trackpoint-stem-hole-radius (* thickness 3))
+                     screw-hole
+                     (mirror [1 0 0] screw-hole)
+                     (translate [0 (- (/ 37 2) 8) (- -2.5 thickness)] (cube 27 37 5))
+                     )))))
+
+; The TrackPoint sits in the gap between four keys, so every TrackPoint part shares this placement
+(def trackpoint-placement (key-place-transform 0.5 2.5))
 
 (def trackpoint-holes-placed
-  (key-place 0.5 2.5 (trackpoint-holes trackpoint-mount-thickness trackpoint-screw-hole-radius)))
+  (rounded-multmatrix trackpoint-placement (trackpoint-holes trackpoint-mount-thickness trackpoint-screw-hole-radius)))
 
 (defn trackpoint-mount [thickness hole-radius]
   (let [
         cutout-x-offset 8
         cutout-y-offset (+ (* hole-radius 2.1) 5)
+        cutout (cube 10 10 20)
+        cutout-pair (union (translate [cutout-x-offset cutout-y-offset 0] cutout)
+                           (translate [cutout-x-offset (- cutout-y-offset) 0] cutout))
+        ; An even number of facets, so that the tab is unchanged by the mirror below
+        screw-tab (translate [trackpoint-screw-hole-offset 0 0]
+                             (with-fn 14 (cylinder (* hole-radius 2.1) thickness)))
         ]
     (color
       [0 1 0]
-      (difference
-        (translate
-          [0 0 (/ thickness -2)]
-          (union
+      (translate
+        [0 0 (/ thickness -2)]
+        (union
+          ; The cutouts only overlap the center disc (they just touch the screw tabs' hull), so only cut them from
+          ; the disc instead of from the whole mount.
+          (difference
             (cylinder 8 thickness)
-            (hull
-              (translate [trackpoint-screw-hole-offset 0 0]
-                         (cylinder (* hole-radius 2.1) thickness))
-              (translate [(- trackpoint-screw-hole-offset) 0 0]
-                         (cylinder (* hole-radius 2.1) thickness)))
-            ))
-        (translate [cutout-x-offset cutout-y-offset 0] (cube 10 10 20))
-        (translate [(- cutout-x-offset) cutout-y-offset 0] (cube 10 10 20))
-        (translate [cutout-x-offset (- cutout-y-offset) 0] (cube 10 10 20))
-        (translate [(- cutout-x-offset) (- cutout-y-offset) 0] (cube 10 10 20))
-        ))))
+            cutout-pair
+            (mirror [1 0 0] cutout-pair))
+          (hull
+            screw-tab
+            (mirror [1 0 0] screw-tab))
+          )))))
 
 (def trackpoint-mount-placed
-  (key-place 0.5 2.5 (trackpoint-mount trackpoint-mount-thickness trackpoint-screw-hole-radius)))
+  (rounded-multmatrix trackpoint-placement (trackpoint-mount trackpoint-mount-thickness trackpoint-screw-hole-radius)))
 
 (def trackpoint-stem-radius 0.6)
 (def trackpoint-stem-length 25) ; Slightly problematic since only barbells seem to come in this length
@@ -1054,13 +1040,14 @@
   (color
     [0.8 0.8 0.8]
     (binding [*fs* 0.5]
-      (key-place 0.5 2.5
-                 (translate
-                   [0 0 (+ (/ trackpoint-stem-length 2) (- trackpoint-mount-thickness) trackpoint-stem-base-height)]
-                   (union
-                     (cylinder trackpoint-stem-radius trackpoint-stem-length)
-                     (translate [0 0 (+ (/ trackpoint-stem-length 2) trackpoint-ball-radius)] (sphere trackpoint-ball-radius))
-                     ))))))
+      (rounded-multmatrix
+        (compose-transforms
+          (translation-matrix [0 0 (+ (/ trackpoint-stem-length 2) (- trackpoint-mount-thickness) trackpoint-stem-base-height)])
+          trackpoint-placement)
+        (union
+          (cylinder trackpoint-stem-radius trackpoint-stem-length)
+          (translate [0 0 (+ (/ trackpoint-stem-length 2) trackpoint-ball-radius)] (sphere trackpoint-ball-radius))
+          )))))
 
 ;;;;;;;;;;;;;;;;;;;;;;;;;;;
 ;; Boards and Connectors ;;
@@ -1134,16 +1121,25 @@
 (def board-clearance-height 20) ; The amount of clearance above the board to allow for pin headers and connectors
 
 ; Or, rather, "the shape of a USB-C plug or jack" - the hull of two similar cylinders
+; (built as a 2D hull of two circles and extruded once, which is much cheaper to render than a 3D hull)
 (defn elongated-cylinder [[width height length]]
   (let [cylinder-offset (/ (- width height) 2)]
     (binding [*fs* 1]
-      (hull
-        (translate [cylinder-offset 0 (/ length 2)] (cylinder (/ height 2) length))
-        (translate [(- cylinder-offset) 0 (/ length 2)] (cylinder (/ height 2) length))))))
+      (->> (hull
+             (translate [cylinder-offset 0 0] (circle (/ height 2)))
+             (translate [(- cylinder-offset) 0 0] (circle (/ height 2))))
+           (extrude-linear {:height length :twist 0 :convexity 0})
+           (translate [0 0 (/ length 2)])))))
 
 (def usb-c-plug (color [0.1 0.1 0.1] (elongated-cylinder usb-c-plug-dimensions)))
 (def usb-c-jack (elongated-cylinder usb-c-jack-dimensions))
 
+; Where the USB-C jack sits on a board: lowered so its top is flush with the underside of the
+; board, with the jack pointing back along the board and the plug sticking out from it
+(def usb-c-z-offset (/ (nth usb-c-jack-dimensions 1) -2))
+(def usb-c-jack-on-board (rotate (/ π 2) [1 0 0] usb-c-jack))
+(def usb-c-plug-on-board (rotate (/ π -2) [1 0 0] usb-c-plug))
+
 
 (defn board-shape-bare [[x y z]]
   (translate [0 (- (/ y -2) 2) (/ z 2)] (color [0.14 0.2 0.1] (cube x y z))))
@@ -1167,8 +1163,9 @@
         (translate [0 (+ (/ block-length -2) hole-radius) (/ mount-post-height -2)]
                    (cube block-width block-length mount-post-height))
         )
-      (binding [*fs* 0.5] (translate [0 0 (/ mount-post-height -2)]
-                                     (cylinder hole-radius (+ mount-post-height 1)))))))
+      ; An even number of facets, so that the hole is unchanged by the mirror in the USB-C mounts
+      (translate [0 0 (/ mount-post-height -2)]
+                 (with-fn 12 (cylinder hole-radius (+ mount-post-height 1)))))))
 
 (defn board-mount-bare [[x y z]]
   (difference
@@ -1179,38 +1176,38 @@
     (board-cutout-bare [x y z])))
 
 
-(defn board-shape-with-usb-c [[x y z] & {:keys [usb-y-offset] :or {usb-y-offset 0}}]
-  (let [usb-z-offset (/ (nth usb-c-jack-dimensions 1) -2)]
-    (union
-      (translate [0 (/ y -2) (/ z 2)] (color [0.14 0.2 0.1] (cube x y z)))
-      (translate [0 usb-y-offset usb-z-offset] (rotate (/ π 2) [1 0 0] usb-c-jack))
-      )))
+; Memoized, since each board's shape is also part of its cutout and clearance shapes
+(def board-shape-with-usb-c
+  (memoize
+    (fn [[x y z] & {:keys [usb-y-offset] :or {usb-y-offset 0}}]
+      (union
+        (translate [0 (/ y -2) (/ z 2)] (color [0.14 0.2 0.1] (cube x y z)))
+        (translate [0 usb-y-offset usb-c-z-offset] usb-c-jack-on-board)
+        ))))
 
 (defn board-cutout-with-usb-c [[x y z] & {:keys [usb-y-offset] :or {usb-y-offset 0}}]
-  (let [usb-z-offset (/ (nth usb-c-jack-dimensions 1) -2)]
-    (union
-      (board-shape-with-usb-c [x y z] :usb-y-offset usb-y-offset)
-      (translate [0 usb-y-offset usb-z-offset] (rotate (/ π -2) [1 0 0] usb-c-plug))
-      )))
+  (union
+    (board-shape-with-usb-c [x y z] :usb-y-offset usb-y-offset)
+    (translate [0 usb-y-offset usb-c-z-offset] usb-c-plug-on-board)
+    ))
 
 (defn board-clearance-with-usb-c [[x y z] & {:keys [usb-y-offset] :or {usb-y-offset 0}}]
-  (let [usb-z-offset (/ (nth usb-c-jack-dimensions 1) -2)]
-    (union
-      (board-shape-with-usb-c [x y z] :usb-y-offset usb-y-offset)
-      (board-shape-bare [x y (+ z board-clearance-height)])
-      (translate [0 usb-y-offset usb-z-offset] (rotate (/ π -2) [1 0 0] usb-c-plug))
-      )))
+  (union
+    (board-shape-with-usb-c [x y z] :usb-y-offset usb-y-offset)
+    (board-shape-bare [x y (+ z board-clearance-height)])
+    (translate [0 usb-y-offset usb-c-z-offset] usb-c-plug-on-board)
+    ))
 
 (defn board-mount-with-usb-c [[x y z] & {:keys [usb-y-offset] :or {usb-y-offset 0}}]
-  (difference
-    (union
-      (translate [0 (- (- y) 0.75) 0] mount-post)
-      (translate [0 0.75 (- z (/ mount-post-height 2))] (cube (- x 2.08) 1.5 (+ mount-post-height (* 2 z))))
-      (translate [(/ (- x 2.5) 2) 0.5 (- z (/ mount-post-height 2))]
-                 (cube 2.5 3 (+ mount-post-height (* 2 z))))
-      (translate [(/ (- x 2.5) -2) 0.5 (- z (/ mount-post-height 2))]
-                 (cube 2.5 3 (+ mount-post-height (* 2 z)))))
-    (board-cutout-with-usb-c [x y z] :usb-y-offset usb-y-offset)))
+  (let [side-post (translate [(/ (- x 2.5) 2) 0.5 (- z (/ mount-post-height 2))]
+                             (cube 2.5 3 (+ mount-post-height (* 2 z))))]
+    (difference
+      (union
+        (translate [0 (- (- y) 0.75) 0] mount-post)
+        (translate [0 0.75 (- z (/ mount-post-height 2))] (cube (- x 2.08) 1.5 (+ mount-post-height (* 2 z))))
+        side-post
+        (mirror [1 0 0] side-post))
+      (board-cutout-with-usb-c [x y z] :usb-y-offset usb-y-offset))))
 
 (defn board-mount-with-usb-c-alt [[x y z] & {:keys [usb-y-offset] :or {usb-y-offset 0}}]
   (let [x-mount-post-offset (/ (+
@@ -1219,13 +1216,12 @@
                           2.5                           ; Mounting post width
                           ) 2)]
     (difference
-      (union
-        (translate [x-mount-post-offset (- (- y) 0.75) 0] mount-post)
-        (translate [(- x-mount-post-offset) (- (- y) 0.75) 0] mount-post)
-        (translate [x-mount-post-offset 0.5 (- z (/ mount-post-height 2))]
-                   (cube 2.5 3 (+ mount-post-height (* 2 z))))
-        (translate [(- x-mount-post-offset) 0.5 (- z (/ mount-post-height 2))]
-                   (cube 2.5 3 (+ mount-post-height (* 2 z)))))
+      (let [mount-half (union
+                         (translate [x-mount-post-offset (- (- y) 0.75) 0] mount-post)
+                         (translate [x-mount-post-offset 0.5 (- z (/ mount-post-height 2))]
+                                    (cube 2.5 3 (+ mount-post-height (* 2 z)))))]
+        (union mount-half
+               (mirror [1 0 0] mount-half)))
       (board-cutout-with-usb-c [x y z] :usb-y-offset usb-y-offset))))
 
 (defn mount-post-extra-support [[x y z]]
@@ -1282,14 +1278,32 @@
 
 (def board-position [-36.7 56.5 15])
 
+(def board-placement
+  (compose-transforms
+    (rotation-matrix (/ π 2) [1 0 0])
+    (rotation-matrix (/ π -2) [0 1 0])
+    (rotation-matrix (/ π 120) [0 1 0])
+    (rotation-matrix (/ π 12) [1 0 0])
+    (rotation-matrix (/ π -28) [0 0 1])
+    (translation-matrix board-position)))
+
 (defn placed-board [shape]
-  (->> shape
-       (rotate (/ π 2) [1 0 0])
-       (rotate (/ π -2) [0 1 0])
-       (rotate (/ π 120) [0 1 0])
-       (rotate (/ π 12) [1 0 0])
-       (rotate (/ π -28) [0 0 1])
-       (translate board-position)))
+  (rounded-multmatrix board-placement shape))
+
+(def board-mount-placed
+  (placed-board
+    (difference
+      board-mount-micro
+      (translate [0 10 0] (cube 20 20 20)))))
+
+(def board-extra-support-placed
+  (difference
+    (placed-board (mount-post-extra-support board-micro))
+    below-floor))
+
+(def board-clearance-placed (placed-board board-clearance-micro))
+
+(def board-shape-placed (placed-board board-shape-micro))
 
 ;;;;;;;;;;;;;;;;;
 ;; Rubber Feet ;;
@@ -1299,12 +1313,16 @@
 (def foot-lip 0.5)
 (def foot-support-height 5)
 
+(def foot-positions
+  [[-70 -41.5 0]
+   [-33 58.9 0]
+   [78 52 0]
+   [78 -54.4 0]])
+
 (defn place-feet [foot]
-  (union
-    (translate [-70 -41.5 0] foot)
-    (translate [-33 58.9 0] foot)
-    (translate [78 52 0] foot)
-    (translate [78 -54.4 0] foot)))
+  (apply union
+         (for [position foot-positions]
+           (translate position foot))))
 
 (def foot-supports
   (place-feet
@@ -1320,24 +1338,24 @@
 ;; Final Export ;;
 ;;;;;;;;;;;;;;;;;;
 
+; The TrackPoint parts are only added to (and cut from) the case when asked for
+(defn dactyl-top [& {:keys [trackpoint?]}]
+  (apply difference
+         (apply union
+                (cond-> [key-holes
+                         connectors
+                         thumb
+                         new-case-trimmed
+                         board-mount-placed
+                         board-extra-support-placed
+                         foot-supports]
+                  trackpoint? (conj trackpoint-mount-placed)))
+         (cond-> [mini-din-hole-just-circle
+                  board-clearance-placed]
+           trackpoint? (conj trackpoint-holes-placed))))
+
 (def dactyl-top-right
-  (difference
-   (union key-holes
-          connectors
-          thumb
-          new-case-trimmed
-          (placed-board
-            (difference
-              board-mount-micro
-              (translate [0 10 0] (cube 20 20 20))))
-          (difference
-            (placed-board (mount-post-extra-support board-micro))
-            (->> (cube 1000 1000 100) (translate [0 0 -50])))
-          trackpoint-mount-placed
-          foot-supports)
-   mini-din-hole-just-circle
-   trackpoint-holes-placed
-   (placed-board board-clearance-micro)))
+  (dactyl-top :trackpoint? true))
 
 (def dactyl-top-right-preview
   (union
@@ -1346,25 +1364,11 @@
     thumbcaps
     mini-din-panel-mount-jack
     trackpoint-shape
-    (placed-board board-shape-micro)))
+    board-shape-placed))
 
 (def dactyl-top-left
   (mirror [-1 0 0]
-          (difference
-           (union key-holes
-                  connectors
-                  thumb
-                  new-case-trimmed
-                  (placed-board
-                    (difference
-                      board-mount-micro
-                      (translate [0 10 0] (cube 20 20 20))))
-                  (difference
-                    (placed-board (mount-post-extra-support board-micro))
-                    (->> (cube 1000 1000 100) (translate [0 0 -50])))
-                  foot-supports)
-           mini-din-hole-just-circle
-           (placed-board board-clearance-micro))))
+          (dactyl-top :trackpoint? false)))
 
 (def dactyl-top-left-preview
   (union
@@ -1374,7 +1378,7 @@
               caps
               thumbcaps
               mini-din-panel-mount-jack
-              (placed-board board-shape-micro)))))
+              board-shape-placed))))
 
 (defn place-trackpoint-mouse-trackpoint [shape]
   (translate [0 0 10] (rotate [(* π -0.5) 0 0] (translate [0 0 31.5] shape))))
@@ -1393,6 +1397,9 @@
 
 (def trackpoint-mouse
   (let [thumb-buttons-offset [-11.3 5 5]
+        switch-cutout (cube 20 (+ 2 keyswitch-width) (+ 2 keyswitch-height))
+        body-cylinder (binding [*fs* 0.5 *fa* 3]
+                        (translate [0 0 10] (rotate [0 (/ π 2) 0] (cylinder 33 200))))
         ]
     (difference
       (union
@@ -1425,7 +1432,7 @@
                 (difference
                   (union
                     (difference ; Main body cylinder
-                      (translate [0 0 10] (rotate [0 (/ π 2) 0] (cylinder 33 200)))
+                      body-cylinder
                       (difference ; Inner face - cylinder with flattened top
                         (translate [0 0 10] (rotate [0 (/ π 2) 0] (cylinder 30 194)))
                         (translate [0 0 54] (cube 220 66 40)))
@@ -1446,12 +1453,12 @@
                       (place-trackpoint-mouse-thumb-part 0.5 0 31 (cube 3 100 100))
                       ))
                     (union ; Main body profile
-                      (translate [0 0 10] (rotate [0 (/ π 2) 0] (cylinder 33 200)))
+                      body-cylinder
                       (translate [0 0 -9.5] (cube 200 63 19))
                       ))
-                  (place-trackpoint-mouse-thumb-part 0 5 0 (cube 20 (+ 2 keyswitch-width) (+ 2 keyswitch-height)))
-                  (place-trackpoint-mouse-thumb-part 0 5 19.5 (cube 20 (+ 2 keyswitch-width) (+ 2 keyswitch-height)))
-                  (place-trackpoint-mouse-thumb-part 0 -14.5 19.5 (cube 20 (+ 2 keyswitch-width) (+ 2 keyswitch-height)))
+                  (place-trackpoint-mouse-thumb-part 0 5 0 switch-cutout)
+                  (place-trackpoint-mouse-thumb-part 0 5 19.5 switch-cutout)
+                  (place-trackpoint-mouse-thumb-part 0 -14.5 19.5 switch-cutout)
                   )))))
 
         (difference
@@ -1474,73 +1481,44 @@
           (place-trackpoint-mouse-trackpoint (translate [0 0 1] (cylinder [4.5 8.5] 3))) ; Stem hole counterbore
           (place-trackpoint-mouse-board board-clearance-pro-micro))))))
 
-(spit "things/trackpoint-mouse.scad"
-      (write-scad trackpoint-mouse))
-
-(spit "things/alps-single-plate.scad"
-      (write-scad alps-single-plate))
-
-(spit "things/cherry-plate-with-key-mount.scad"
-      (write-scad cherry-plate-with-key-mount))
-
-(spit "things/cherry-plate-with-key-mount-and-backplate.scad"
-      (write-scad cherry-plate-with-key-mount-and-backplate))
-
-(spit "things/cherry-backplate.scad"
-      (write-scad cherry-backplate))
-
-(spit "things/key-holes.scad"
-      (write-scad (union connectors key-holes)))
-
-(spit "things/dactyl-top-right.scad"
-      (write-scad dactyl-top-right))
-
-(spit "things/dactyl-top-left.scad"
-      (write-scad dactyl-top-left))
-
-(spit "things/dactyl-preview.scad"
-      (write-scad (union
-                    (translate [-115 0 0] (rotate (/ π -10) [0 0 1] dactyl-top-left-preview))
-                    (translate [115 0 0] (rotate (/ π 10) [0 0 1] dactyl-top-right-preview)))))
-
-(spit "things/board-proton-c.scad"
-      (write-scad (union
-                    (translate [0 0 20] board-shape-proton-c)
-                    board-cutout-proton-c
-                    (translate [0 0 0] board-mount-proton-c)
-                    )))
-
-(spit "things/board-pro-mini.scad"
-      (write-scad (union
-                    (translate [0 0 20] board-shape-pro-mini)
-                    board-cutout-pro-mini
-                    (translate [0 0 0] board-mount-pro-mini)
-                    )))
-
-(spit "things/board-blue-pill.scad"
-      (write-scad (union
-                    (translate [0 0 20] board-shape-blue-pill)
-                    board-cutout-blue-pill
-                    (translate [0 0 0] board-mount-blue-pill)
-                    )))
-
-(spit "things/board-black-pill.scad"
-      (write-scad (union
-                    (translate [0 0 20] board-shape-black-pill)
-                    board-cutout-black-pill
-                    (translate [0 0 0] board-mount-black-pill)
-                    )))
-
-(spit "things/board-micro.scad"
-      (write-scad (union
-                    (translate [0 0 20] board-shape-micro)
-                    board-cutout-micro
-                    (translate [0 0 0] board-mount-micro)
-                    )))
-
-(spit "things/board-pro-micro.scad"
-      (write-scad (union
-                    (translate [0 0 20] board-shape-pro-micro)
-                    board-cutout-pro-micro
-                    (translate [0 0 0] board-mount-pro-micro)
-                    )))
+;; Every generated file, as [path shape]
+(def scad-outputs
+  (concat
+    [["things/trackpoint-mouse.scad" trackpoint-mouse]
+     ["things/alps-single-plate.scad" alps-single-plate]
+     ["things/cherry-plate-with-key-mount.scad" cherry-plate-with-key-mount]
+     ["things/cherry-plate-with-key-mount-and-backplate.scad" cherry-plate-with-key-mount-and-backplate]
+     ["things/cherry-backplate.scad" cherry-backplate]
+     ["things/key-holes.scad" (union connectors key-holes)]
+     ["things/dactyl-top-right.scad" dactyl-top-right]
+     ["things/dactyl-top-left.scad" dactyl-top-left]
+     ["things/dactyl-preview.scad" (union
+                                     (translate [-115 0 0] (rotate (/ π -10) [0 0 1] dactyl-top-left-preview))
+                                     (translate [115 0 0] (rotate (/ π 10) [0 0 1] dactyl-top-right-preview)))]]
+
+    ;; Board previews: the board shape floating above its cutout and mount
+    (for [[board-name board-shape board-cutout board-mount]
+          [["proton-c" board-shape-proton-c board-cutout-proton-c board-mount-proton-c]
+           ["pro-mini" board-shape-pro-mini board-cutout-pro-mini board-mount-pro-mini]
+           ["blue-pill" board-shape-blue-pill board-cutout-blue-pill board-mount-blue-pill]
+           ["black-pill" board-shape-black-pill board-cutout-black-pill board-mount-black-pill]
+           ["micro" board-shape-micro board-cutout-micro board-mount-micro]
+           ["pro-micro" board-shape-pro-micro board-cutout-pro-micro board-mount-pro-micro]]]
+      [(str "things/board-" board-name ".scad")
+       (union
+         (translate [0 0 20] board-shape)
+         board-cutout
+         (translate [0 0 0] board-mount)
+         )])))
+
+; The files don't depend on each other, and writing out the big case models takes most of a
+; load, so they're written in parallel. They're written from a pool that's shut down once they're
+; done, rather than with pmap, whose idle threads would keep a non-REPL run alive for a minute.
+(let [pool (java.util.concurrent.Executors/newFixedThreadPool
+             (.availableProcessors (Runtime/getRuntime)))]
+  (try
+    (doseq [written (.invokeAll pool (for [[path shape] scad-outputs]
+                                       #(spit path (write-scad shape))))]
+      (.get written))
+    (finally
+      (.shutdown pool))))
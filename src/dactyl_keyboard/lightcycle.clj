@@ -61,10 +61,7 @@
                                              (/ alps-notch-height 2))]))
                          )
         plate-half (union top-wall left-wall)]
-    (union plate-half
-           (->> plate-half
-                (mirror [1 0 0])
-                (mirror [0 1 0])))))
+    (union-with-half-turn plate-half)))
 
 
 ;;;;;;;;;;;;;;;;
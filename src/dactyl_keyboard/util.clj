@@ -1,11 +1,28 @@
 (ns dactyl-keyboard.util
   (:refer-clojure :exclude [use import])
-  (:require [scad-clj.model :refer :all]))
+  (:require [scad-clj.scad :refer [write-scad]]
+            [scad-clj.model :refer :all]
+            [clojure.java.io :as io]
+            [clojure.java.shell :refer [sh]]))
+
+; The individual hulls of `triangle-hulls`, for callers that union many strips together at once
+(defn triangle-hull-seq [& shapes]
+  (map (partial apply hull)
+       (partition 3 1 shapes)))
 
 (defn triangle-hulls [& shapes]
-  (apply union
-         (map (partial apply hull)
-              (partition 3 1 shapes))))
+  (apply union (apply triangle-hull-seq shapes)))
+
+; Unions the shapes as a balanced binary tree instead of one long flat union, so that
+; OpenSCAD only ever has to merge two similarly-sized halves at a time.
+(defn balanced-union [shapes]
+  (let [shapes (vec shapes)
+        half (quot (count shapes) 2)]
+    (case (count shapes)
+      0 (union)
+      1 (first shapes)
+      (union (balanced-union (subvec shapes 0 half))
+             (balanced-union (subvec shapes half))))))
 
 (defn bottom [height p]
   (->> (project p)
@@ -14,3 +31,98 @@
 
 (defn bottom-hull [p]
   (hull p (bottom 1 p)))
+
+; Unions a shape with its copy mirrored across both X and Y; those two mirrors amount to a
+; half turn around Z, so it is emitted as a single rotation.
+(defn union-with-half-turn [half]
+  (union half
+         (rotate [0 0 Math/PI] half)))
+
+;;;;;;;;;;;;;;;;;;;;;;;;;;;;;
+;; Transformation Matrices ;;
+;;;;;;;;;;;;;;;;;;;;;;;;;;;;;
+
+(defn translation-matrix [[x y z]]
+  [[1 0 0 x]
+   [0 1 0 y]
+   [0 0 1 z]
+   [0 0 0 1]])
+
+; Rotation by `a` radians around the axis `[x y z]`, equivalent to `(rotate a [x y z] shape)`
+(defn rotation-matrix [a [x y z]]
+  (let [length (Math/sqrt (+ (* x x) (* y y) (* z z)))
+        x (/ x length)
+        y (/ y length)
+        z (/ z length)
+        c (Math/cos a)
+        s (Math/sin a)
+        t (- 1 c)]
+    [[(+ (* t x x) c) (- (* t x y) (* s z)) (+ (* t x z) (* s y)) 0]
+     [(+ (* t x y) (* s z)) (+ (* t y y) c) (- (* t y z) (* s x)) 0]
+     [(- (* t x z) (* s y)) (+ (* t y z) (* s x)) (+ (* t z z) c) 0]
+     [0 0 0 1]]))
+
+(defn matrix-multiply [a b]
+  (let [b-columns (apply map vector b)]
+    (vec (for [a-row a]
+           (vec (for [b-column b-columns]
+                  (reduce + (map * a-row b-column))))))))
+
+; Combines transformation matrices into one, applying them in the order given (like `->>`)
+(defn compose-transforms [& transforms]
+  (reduce (fn [composed transform] (matrix-multiply transform composed))
+          transforms))
+
+; Rounds `x` to `places` decimal places
+(defn round-to [places x]
+  (let [scale (Math/pow 10 places)]
+    (/ (Math/round (* x scale)) scale)))
+
+; Emitted matrices are rounded to this many decimal places, which keeps the trig noise
+; (e.g. 6.123233995736766E-17 in place of 0) out of the SCAD output
+(def matrix-places 6)
+
+; `multmatrix` with the matrix rounded to `matrix-places` first. Only the final, emitted matrix
+; is rounded; composing stays exact, so the rounding error doesn't compound.
+(defn rounded-multmatrix [m shape]
+  (multmatrix (mapv (partial mapv (partial round-to matrix-places)) m)
+              shape))
+
+;;;;;;;;;;;;;;;
+;; STL Cache ;;
+;;;;;;;;;;;;;;;
+
+; Directory to cache rendered subassemblies in as STL files. Off (nil) by default; to turn it
+; on, load the design with it bound (the namespace has to be loaded first so the var exists):
+;   (require 'dactyl-keyboard.util)
+;   (binding [dactyl-keyboard.util/*stl-cache-dir* "things/stl-cache"]
+;     (load-file "src/dactyl_keyboard/dactyl.clj"))
+; things/stl-cache is git-ignored, since every geometry change leaves a new .scad/.stl pair there.
+(def ^:dynamic *stl-cache-dir* nil)
+
+(defn- sha-1 [s]
+  (->> (.digest (java.security.MessageDigest/getInstance "SHA-1") (.getBytes s "UTF-8"))
+       (map #(format "%02x" %))
+       (apply str)))
+
+; When the STL cache is on, renders `shape` to an STL file with OpenSCAD (unless a render of the
+; exact same SCAD source is already cached) and imports that in its place, so every model that
+; uses the shape skips re-evaluating its CSG tree. Otherwise, returns `shape` unchanged.
+(defn cached-stl [name shape]
+  (if-let [cache-dir *stl-cache-dir*]
+    (let [scad (write-scad shape)
+          base-name (str name "-" (sha-1 scad))
+          stl-file (io/file cache-dir (str base-name ".stl"))]
+      (when-not (.exists stl-file)
+        (let [scad-file (io/file cache-dir (str base-name ".scad"))
+              partial-file (io/file cache-dir (str base-name ".partial.stl"))]
+          (io/make-parents scad-file)
+          (spit scad-file scad)
+          (let [{:keys [exit err]} (sh "openscad" "-o" (.getPath partial-file) (.getPath scad-file))]
+            (when-not (zero? exit)
+              (throw (ex-info (str "OpenSCAD failed to render " name ": " err) {:exit exit}))))
+          (when-not (.renameTo partial-file stl-file)
+            (throw (ex-info (str "OpenSCAD did not produce an STL file for " name)
+                            {:file (.getPath partial-file)})))))
+      (import (.getAbsolutePath stl-file)))
+    shape))
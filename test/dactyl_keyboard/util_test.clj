@@ -0,0 +1,48 @@
+(ns dactyl-keyboard.util-test
+  (:refer-clojure :exclude [use import])
+  (:require [clojure.test :refer :all]
+            [scad-clj.model :refer :all]
+            [dactyl-keyboard.util :refer :all]))
+
+(defn transform-point [m [x y z]]
+  (->> (matrix-multiply m [[x] [y] [z] [1]])
+       (take 3)
+       (mapv first)))
+
+(defn approx= [a b]
+  (every? true? (map (fn [x y] (< (Math/abs (- x y)) 1e-9)) a b)))
+
+(deftest rotation-matrix-test
+  (testing "a quarter turn about X takes Y to Z and Z to -Y"
+    (let [m (rotation-matrix (/ Math/PI 2) [1 0 0])]
+      (is (approx= [0 0 1] (transform-point m [0 1 0])))
+      (is (approx= [0 -1 0] (transform-point m [0 0 1])))
+      (is (approx= [1 0 0] (transform-point m [1 0 0])))))
+  (testing "a half turn about [1 1 0] swaps X and Y and flips Z"
+    (let [m (rotation-matrix Math/PI [1 1 0])]
+      (is (approx= [0 1 0] (transform-point m [1 0 0])))
+      (is (approx= [1 0 0] (transform-point m [0 1 0])))
+      (is (approx= [0 0 -1] (transform-point m [0 0 1]))))))
+
+(deftest compose-transforms-test
+  (testing "transforms are applied in the order given, like ->>"
+    (let [m (compose-transforms
+              (translation-matrix [1 0 0])
+              (rotation-matrix (/ Math/PI 2) [0 0 1]))]
+      ; Translated to [1 0 0] first, then turned a quarter about Z
+      (is (approx= [0 1 0] (transform-point m [0 0 0])))))
+  (testing "a single transform is returned as is"
+    (is (= (translation-matrix [1 2 3])
+           (compose-transforms (translation-matrix [1 2 3]))))))
+
+(deftest balanced-union-test
+  (let [a (cube 1 1 1)
+        b (sphere 1)
+        c (cylinder 1 2)]
+    (testing "no shapes is an empty union"
+      (is (= (union) (balanced-union []))))
+    (testing "a single shape is returned without a union"
+      (is (= a (balanced-union [a]))))
+    (testing "an odd number of shapes is split into two halves"
+      (is (= (union a (union b c))
+             (balanced-union [a b c]))))))